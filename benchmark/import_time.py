@@ -0,0 +1,49 @@
+#! /usr/bin/env python
+
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+"""Measure the time it takes to import the interval package.
+
+Each statement is timed in a fresh interpreter, and the time of an
+empty interpreter is reported for comparison. Usage:
+
+    python benchmark/import_time.py [repetitions]
+
+"""
+
+from __future__ import print_function
+
+import subprocess
+import sys
+import timeit
+
+statements = [
+    'pass',
+    'import interval',
+    'from interval import interval',
+    'from interval import interval, imath',
+    'from interval import imath; imath.pi',
+]
+
+
+def measure(statement, repetitions):
+    "Return the sorted times of repeatedly running the statement in a new interpreter."
+    times = []
+    for i in range(repetitions):
+        start = timeit.default_timer()
+        subprocess.check_call([sys.executable, '-c', statement])
+        times.append(timeit.default_timer() - start)
+    return sorted(times)
+
+
+def main(repetitions=20):
+    for statement in statements:
+        times = measure(statement, repetitions)
+        print('%-40s min %6.1f ms   median %6.1f ms' % (
+            statement, 1e3 * times[0], 1e3 * times[len(times) // 2]))
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
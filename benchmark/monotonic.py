@@ -0,0 +1,41 @@
+#! /usr/bin/env python
+
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+"""Measure the time per call of the monotonic imath functions.
+
+The time of the bare crlibm calls is reported for comparison, so that
+the difference is the overhead of the interval wrapper. Usage:
+
+    python benchmark/monotonic.py [calls]
+
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+import crlibm
+from interval import interval, imath
+
+cases = [
+    ('crlibm.exp_rd and exp_ru', lambda x: (crlibm.exp_rd(1.0), crlibm.exp_ru(2.0)), None),
+    ('exp, one component', imath.exp, interval[1, 2]),
+    ('log, one component in domain', imath.log, interval[1, 2]),
+    ('log, clipped to domain', imath.log, interval[-1, 2]),
+    ('exp, three components', imath.exp, interval([1, 2], [3, 4], 5)),
+    ('exp, scalar', imath.exp, 1.5),
+]
+
+
+def main(calls=100000):
+    for name, f, x in cases:
+        best = min(timeit.repeat(lambda: f(x), number=calls, repeat=3))
+        print('%-32s %8.2f us' % (name, 1e6 * best / calls))
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
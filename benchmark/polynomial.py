@@ -0,0 +1,45 @@
+#! /usr/bin/env python
+
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+"""Measure the evaluation and the root finding of polynomials.
+
+The times of the equivalent interval expressions and of the generic
+interval Newton method are reported for comparison. Usage:
+
+    python benchmark/polynomial.py [calls]
+
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+from interval import interval
+from interval.polynomial import polynomial
+
+p = polynomial([1, -2, 0, 1])
+dp = p.derivative()
+x = interval[0.5, 0.7]
+
+cases = [
+    ('x ** 3 - 2 * x + 1', lambda: x ** 3 - 2 * x + 1),
+    ('p(x)', lambda: p(x)),
+    ('p.centered(x)', lambda: p.centered(x)),
+    ('interval.newton', lambda: interval[-10, 10].newton(lambda x: x ** 3 - 2 * x + 1, lambda x: 3 * x ** 2 - 2)),
+    ('interval.newton with p', lambda: interval[-10, 10].newton(p, dp)),
+    ('p.roots()', lambda: p.roots()),
+]
+
+
+def main(calls=1000):
+    for name, f in cases:
+        best = min(timeit.repeat(f, number=calls, repeat=3))
+        print('%-32s %10.2f us' % (name, 1e6 * best / calls))
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
@@ -0,0 +1,42 @@
+#! /usr/bin/env python
+
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+"""Measure the time per call of imath.pow and imath.root.
+
+The time of the composition of exp and log is reported for comparison.
+Usage:
+
+    python benchmark/power.py [calls]
+
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+from interval import interval, imath
+
+x, y = interval[2, 3], interval[1.5, 1.7]
+
+cases = [
+    ('exp(y * log(x)), real y', lambda: imath.exp(1.7 * imath.log(x))),
+    ('pow(x, y), real y', lambda: imath.pow(x, 1.7)),
+    ('exp(y * log(x)), interval y', lambda: imath.exp(y * imath.log(x))),
+    ('pow(x, y), interval y', lambda: imath.pow(x, y)),
+    ('exp(log(x) / 3)', lambda: imath.exp(imath.log(x) / 3)),
+    ('root(x, 3)', lambda: imath.root(x, 3)),
+]
+
+
+def main(calls=100000):
+    for name, f in cases:
+        best = min(timeit.repeat(f, number=calls, repeat=3))
+        print('%-32s %8.2f us' % (name, 1e6 * best / calls))
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
@@ -0,0 +1,39 @@
+#! /usr/bin/env python
+
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+"""Measure the time per call of the fused trigonometric functions.
+
+The time of the separate calls is reported for comparison. Usage:
+
+    python benchmark/trigonometric.py [calls]
+
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+from interval import interval, imath
+
+x = interval([0.5, 1], [2, 2.5])
+
+cases = [
+    ('sin(x), cos(x)', lambda: (imath.sin(x), imath.cos(x))),
+    ('sincos(x)', lambda: imath.sincos(x)),
+    ('sinpi(x), cospi(x)', lambda: (imath.sinpi(x), imath.cospi(x))),
+    ('sincospi(x)', lambda: imath.sincospi(x)),
+]
+
+
+def main(calls=100000):
+    for name, f in cases:
+        best = min(timeit.repeat(f, number=calls, repeat=3))
+        print('%-32s %8.2f us' % (name, 1e6 * best / calls))
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
@@ -1,5 +1,10 @@
+import sys
 import pytest
 
+# Shared memory blocks are available only from Python 3.8
+collect_ignore = [] if sys.version_info >= (3, 8) else ['interval/shared.py']
+
+
 @pytest.fixture(autouse=True)
 def py2or3(cov):
     """Ignore code pathways specific to other Python versions."""
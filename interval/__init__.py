@@ -16,9 +16,11 @@ into the current namespace:
 """
 
 from six import with_metaclass
-from . import fpu
+from . import fpu, memo
 inf = fpu.infinity
 
+__all__ = ['fpu', 'imath', 'inf', 'interval']
+
 
 def coercing(f):
     from functools import wraps
@@ -44,9 +46,15 @@ def comp_by_comp(f):
                 for y in self.cast(other))
         except self.ScalarError:
             return NotImplemented
+    wrapper.pairwise = True
     return wrapper
 
 
+def _from_bytes(cls, data):
+    "Reconstruct an interval upon unpickling."
+    return cls.from_bytes(data)
+
+
 class Metaclass(type):
     def __getitem__(self, arg):
         return self(arg)
@@ -100,15 +108,46 @@ class interval(with_metaclass(Metaclass, tuple)):
                 raise cls.ComponentError("Invalid interval component: " + repr(x))
         return cls.union(process(x) for x in args)
 
-    def __getnewargs__(self):
-        """Return the values passed to constructor upon unpickling."""
-        return tuple(tuple(c) for c in self)
+    def __reduce__(self):
+        """Return the binary representation passed to from_bytes upon unpickling."""
+        return _from_bytes, (type(self), self.to_bytes())
 
     @classmethod
     def new(cls, components):
         "Create a new interval from existing components."
         return tuple.__new__(cls, components)
 
+    def to_bytes(self):
+        """Return a compact binary representation of the interval.
+
+        The representation consists of the number of components, as a
+        little-endian unsigned 64-bit integer, followed by the
+        endpoints, as little-endian 64-bit floats:
+
+            >>> len(interval([1, 2], 3).to_bytes())
+            40
+
+        """
+        import struct
+        return struct.pack('<Q%dd' % (2 * len(self)), len(self), *[x for c in self for x in c])
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Create an interval from the binary representation returned by to_bytes.
+
+        The components are assumed to be already in canonical form, and
+        are neither validated nor sorted:
+
+            >>> interval.from_bytes(interval([1, 2], 3).to_bytes())
+            interval([1.0, 2.0], [3.0])
+
+        """
+        import struct
+        n, = struct.unpack_from('<Q', data)
+        endpoints = iter(struct.unpack_from('<%dd' % (2 * n), data, 8))
+        component = cls.Component
+        return cls.new([tuple.__new__(component, c) for c in zip(endpoints, endpoints)])
+
     @classmethod
     def cast(cls, x):
         """Cast a scalar to an interval.
@@ -132,7 +171,7 @@ class interval(with_metaclass(Metaclass, tuple)):
         return cls.new((cls.Component(y, y),))
 
     @classmethod
-    def function(cls, f):
+    def function(cls, f=None, increasing=None, breakpoints=(), rd=None, ru=None, derivative=None):
         """Decorator creating an interval function from a function on a single component.
 
         The original function accepts one argument and returns a sequence
@@ -144,18 +183,119 @@ class interval(with_metaclass(Metaclass, tuple)):
             >>> mirror(interval([1, 2], 3))
             interval([-3.0], [-2.0, -1.0], [1.0, 2.0], [3.0])
 
+        The values of f are cached if interval.memo is enabled.
+
+        Alternatively, the decorator accepts annotations declaring that
+        f is monotonic, in which case f is evaluated only on the
+        degenerate components at the endpoints of each component:
+
+            >>> @interval.function(increasing=[False, True], breakpoints=[0.5])
+            ... def f(c):
+            ...     x = interval.new((c,))
+            ...     return x * x - x
+            >>> x = interval[0, 2]
+            >>> f(x), x * x - x
+            (interval([-0.25, 2.0]), interval([-2.0, 4.0]))
+
+        The argument increasing is either a boolean, or a sequence of
+        booleans stating whether f is increasing or decreasing between
+        consecutive breakpoints. The lower bound of the image of a
+        component is the lower bound of the image under f of the
+        appropriate endpoint of the component, and similarly for the
+        upper bound. If f is correctly rounded, the scalar functions
+        rd and ru computing its values rounded downwards and upwards
+        can be specified instead, e.g., crlibm.exp_rd and crlibm.exp_ru.
+        A piece where f is empty at an endpoint is evaluated as a whole.
+
+        If derivative, an interval function enclosing the derivative of
+        f, is specified, it is evaluated on each piece of the argument.
+        An interval.MonotonicityError is raised if its sign contradicts
+        the annotations, and the piece is evaluated as a whole if its
+        sign does not confirm them.
         """
 
         from functools import wraps
+        if f is None:
+            return lambda f: cls.function(f, increasing, breakpoints, rd, ru, derivative)
+        if increasing is not None:
+            return cls._monotonic(f, increasing, breakpoints, rd, ru, derivative)
 
         @wraps(f)
         def wrapper(x):
+            if memo.enabled:
+                return cls._canonical(
+                    cls.Component(*t)
+                    for c in cls.cast(x)
+                    for t in memo.call(f, c))
             return cls._canonical(
                 cls.Component(*t)
                 for c in cls.cast(x)
                 for t in f(c))
         return wrapper
 
+    @classmethod
+    def _monotonic(cls, f, increasing, breakpoints, rd, ru, derivative):
+        "Create an interval function evaluating a piecewise monotonic function at the endpoints."
+        from bisect import bisect_right
+        from functools import wraps
+        breakpoints = sorted(breakpoints)
+        if increasing in (True, False):
+            increasing = [increasing] * (len(breakpoints) + 1)
+        increasing = list(increasing)
+        if len(increasing) != len(breakpoints) + 1:
+            raise ValueError("There must be one annotation more than breakpoints")
+
+        def image(c):
+            "The components of the image of c under f."
+            return [cls.Component(*t) for t in (memo.call(f, c) if memo.enabled else f(c))]
+
+        def at(x, i):
+            "Return the lower (i=0) or upper (i=-1) bound of f at x, or None if empty."
+            y = cls._canonical(image(cls.Component(x, x)))
+            return y[i][i] if y else None
+        rd = rd or (lambda x: at(x, 0))
+        ru = ru or (lambda x: at(x, -1))
+
+        def pieces(c):
+            "Split a component at the breakpoints, tagging each piece with its annotation."
+            a, b = c
+            i = bisect_right(breakpoints, a)
+            while i < len(breakpoints) and breakpoints[i] < b:
+                yield a, breakpoints[i], increasing[i]
+                a, i = breakpoints[i], i + 1
+            yield a, b, increasing[i]
+
+        @wraps(f)
+        def wrapper(x):
+            components = []
+            for c in cls.cast(x):
+                for a, b, up in pieces(c):
+                    if derivative is not None:
+                        d = derivative(cls.new((cls.Component(a, b),)))
+                        if d and (d[-1].sup < 0 if up else d[0].inf > 0):
+                            raise cls.MonotonicityError("%s is not %s on [%r, %r]" % (
+                                getattr(f, '__name__', f), 'increasing' if up else 'decreasing', a, b))
+                        if not d or (d[0].inf < 0 if up else d[-1].sup > 0):
+                            # The monotonicity cannot be verified
+                            components.extend(image(cls.Component(a, b)))
+                            continue
+                    lo, hi = (rd(a), ru(b)) if up else (rd(b), ru(a))
+                    if lo is None or hi is None:
+                        components.extend(image(cls.Component(a, b)))
+                    else:
+                        components.append(cls.Component(lo, hi))
+            return cls._canonical(components)
+        return wrapper
+
+    @classmethod
+    def profile(cls):
+        """Return a context manager counting and timing the interval operations in a block.
+
+        See interval.profiling for the details.
+        """
+        from .profiling import profile
+        return profile()
+
     @classmethod
     def _canonical(cls, components):
         from operator import itemgetter
@@ -234,7 +374,8 @@ class interval(with_metaclass(Metaclass, tuple)):
             'interval([-2.1, +3.4])'
 
         """
-        return type(self).__name__ + '(' + ', '.join('[' + ', '.join(fs % x for x in sorted(set(c))) + ']' for c in self) + ')'
+        one, two = '[' + fs + ']', '[' + fs + ', ' + fs + ']'
+        return type(self).__name__ + '(' + ', '.join([one % c[0] if c[0] == c[1] else two % c for c in self]) + ')'
 
     def __pos__(self):
         return self
@@ -279,20 +420,34 @@ class interval(with_metaclass(Metaclass, tuple)):
     def __pow__(self, n):
         if not fpu.isinteger(n):
             return NotImplemented
-        if n < 0:
-            return (self ** -n).inverse()
-        if n % 2:
-            def pow(c):
-                return (fpu.power_rd(c.inf, n), fpu.power_ru(c.sup, n))
+        if n == 0:
+            return self.new((self.Component(1.0, 1.0),) if self else ())
+        m = abs(n)
+        if m % 2:
+            pairs = self
         else:
-            def pow(c):
-                if c.inf > 0:
-                    return (fpu.power_rd(c.inf, n), fpu.power_ru(c.sup, n))
-                if c.sup < 0:
-                    return (fpu.power_rd(c.sup, n), fpu.power_ru(c.inf, n))
-                else:
-                    return (0.0, fpu.max(fpu.power_ru(x, n) for x in c))
-        return self._canonical(self.Component(*pow(c)) for c in self)
+            pairs = [
+                c if c.inf > 0 else (c.sup, c.inf) if c.sup < 0 else (0.0, max(-c.inf, c.sup))
+                for c in self]
+        bounds = fpu.power_bounds(pairs, m)
+        if n < 0:
+            bounds = fpu.down(lambda: self._inverse_bounds(bounds))
+        if len(bounds) == 1:
+            return self.new((self.Component(*bounds[0]),))
+        return self._canonical(self.Component(a, b) for a, b in bounds)
+
+    @staticmethod
+    def _inverse_bounds(bounds):
+        "The bounds of the inverses of the components with the given bounds, when rounding downwards."
+        inf = fpu.infinity
+        result = []
+        for a, b in bounds:
+            if a <= 0 <= b:
+                result.append((-inf, -(-1.0 / a) if a != 0 else -inf))
+                result.append((1.0 / b if b != 0 else inf, inf))
+            else:
+                result.append((1.0 / b, -(-1.0 / a)))
+        return result
 
     @comp_by_comp
     def __and__(x, y):
@@ -308,6 +463,60 @@ class interval(with_metaclass(Metaclass, tuple)):
     def __ror__(self, other):
         return self | other
 
+    def _subtract(self, other):
+        "The components of the closure of self minus other, in ascending order."
+        gaps = [-inf] + [x for c in other for x in c] + [inf]
+        components, i, j = [], 0, 0
+        while i < len(self) and j < len(gaps):
+            lo, hi = self[i]
+            glo, ghi = gaps[j], gaps[j + 1]
+            a, b = fpu.max((lo, glo)), fpu.min((hi, ghi))
+            # The gaps are open, except the outer ones at -inf and +inf
+            # unless other contains them.
+            closed = glo < ghi
+            if a < b or a == b and (glo < a or j == 0 and closed) and (a < ghi or j + 2 == len(gaps) and closed):
+                if components and a <= components[-1].sup:
+                    components[-1] = self.Component(components[-1].inf, b)
+                else:
+                    components.append(self.Component(a, b))
+            if hi <= ghi:
+                i += 1
+            if ghi <= hi:
+                j += 2
+        return components
+
+    def difference(self, other):
+        """Return the closure of the set of the points of self not in other.
+
+            >>> interval([0, 4], [6, 8]).difference(interval([1, 2], [3, 7]))
+            interval([0.0, 1.0], [2.0, 3.0], [7.0, 8.0])
+            >>> interval[0, 2].difference(1)
+            interval([0.0, 2.0])
+
+        The subtraction operator is reserved for the arithmetic
+        difference.
+        """
+        return self.new(self._subtract(self.cast(other)))
+
+    def complement(self):
+        """Return the closure of the set of the points not in self.
+
+            >>> interval([-inf, 0], [1, 2]).complement()
+            interval([0.0, 1.0], [2.0, inf])
+
+        """
+        return type(self)[-inf, inf].difference(self)
+
+    def symmetric_difference(self, other):
+        """Return the closure of the set of the points in either self or other, but not in both.
+
+            >>> interval[0, 2].symmetric_difference(interval[1, 3])
+            interval([0.0, 1.0], [2.0, 3.0])
+
+        """
+        other = self.cast(other)
+        return self._canonical(self._subtract(other) + other._subtract(self))
+
     @coercing
     def __contains__(self, other):
         return all(any(x.inf <= y.inf and y.sup <= x.sup for x in self) for y in other)
@@ -321,6 +530,9 @@ class interval(with_metaclass(Metaclass, tuple)):
     class ScalarError(ValueError):
         pass
 
+    class MonotonicityError(ValueError):
+        pass
+
     class Component(tuple):
 
         def __new__(cls, inf, sup):
@@ -374,10 +586,22 @@ class interval(with_metaclass(Metaclass, tuple)):
             except NameError:  # pragma: PY3 only
                 _range = range
             tracer_cb('branch', current)
+            # The evaluations at the midpoint serve both the first
+            # Newton step and the centered form, which can prove that
+            # there are no roots.
+            m = current.midpoint
+            fm, slope = f(m), p(current)
+            if 0 not in fm + slope * (current - m):
+                tracer_cb('exclude', current)
+                return self.new(())
+            first = (m - fm / slope) & current
             for n in _range(maxiter):
                 previous = current
                 for anchor in some(current):
-                    current = step(anchor, current)
+                    if first is not None:
+                        current, first = first, None
+                    else:
+                        current = step(anchor, current)
                     if current != previous:
                         tracer_cb('step', current)
                         break
@@ -409,4 +633,25 @@ interval.inverse = interval.function(getattr(interval.inverse, '__func__', inter
 # Clean up the namespace
 del coercing, comp_by_comp, Metaclass, with_metaclass
 
-from . import imath  # noqa
+
+def __getattr__(name):
+    """Import the imath module on first access.
+
+    Loading imath imports crlibm, which is unnecessary for programs
+    that only use the interval class.
+    """
+    if name == 'imath':
+        from importlib import import_module
+        return import_module(__name__ + '.imath')
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(['imath']))
+
+
+import sys  # noqa
+if sys.version_info < (3, 7):  # pragma: nocover
+    # Module-level __getattr__ is available only from Python 3.7
+    from . import imath  # noqa
+del sys
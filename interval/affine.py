@@ -0,0 +1,305 @@
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+"""\
+``interval.affine`` --- Affine arithmetic
+-----------------------------------------
+
+This module provides the affine class, which keeps track of the
+first-order dependencies between quantities that interval arithmetic
+treats as unrelated:
+
+    >>> from interval import interval
+    >>> x = interval[1, 2]
+    >>> x - x
+    interval([-1.0, 1.0])
+    >>> y = affine(x)
+    >>> (y - y).hull
+    interval([0.0])
+
+Affine forms mix freely with intervals and scalars, and the functions
+of this module extend those of ``interval.imath`` by linearization:
+
+    >>> (y * (3 - y)).hull
+    interval([2.0, 2.5])
+    >>> exp(y - y).hull
+    interval([1.0])
+
+"""
+
+from itertools import count
+from . import interval, fpu, imath
+
+
+def _isfinite(x):
+    return -fpu.infinity < x < fpu.infinity
+
+
+class affine(object):
+    """An affine form x0 + x1 * e1 + ... + xn * en on the real set.
+
+    The noise symbols ei are unknowns in [-1, 1], shared by all the
+    affine forms derived from the same input. An affine form is
+    created from an interval or a scalar, and each such creation
+    introduces a new noise symbol:
+
+        >>> affine(interval[1, 3])
+        affine(2.0, 1.0)
+        >>> affine(2)
+        affine(2.0)
+
+    All arithmetic operations are rounded outwards: the rounding
+    errors are collected into a new noise symbol, so that the hull of
+    the result always encloses the exact result.
+    """
+
+    __slots__ = ('center', 'terms')
+
+    _symbols = count()
+
+    class EmptyError(ValueError):
+        pass
+
+    def __new__(cls, x=0):
+        if isinstance(x, cls):
+            return x
+        x = interval.cast(x)
+        if not x:
+            raise cls.EmptyError("Cannot create an affine form from an empty interval")
+        a, b = x[0].inf, x[-1].sup
+        if a == b:
+            return cls.new(a, {})
+        if not (_isfinite(a) and _isfinite(b)):
+            return cls.new(0.0, {next(cls._symbols): fpu.infinity})
+        m = a / 2 + b / 2
+        return cls.new(m, {next(cls._symbols): fpu.up(lambda: fpu.max((m - a, b - m)))})
+
+    @classmethod
+    def new(cls, center, terms, error=0.0):
+        """Create a new affine form from its center and its terms.
+
+        The terms are a mapping from noise symbols to coefficients. A
+        non-zero error adds a new noise symbol with that coefficient.
+        """
+        self = object.__new__(cls)
+        if error:
+            terms[next(cls._symbols)] = error
+        if not (_isfinite(center) and all(_isfinite(v) for v in terms.values())):
+            center, terms = 0.0, {next(cls._symbols): fpu.infinity}
+        self.center = center
+        self.terms = terms
+        return self
+
+    @classmethod
+    def cast(cls, x):
+        """Cast an interval or a scalar to an affine form.
+
+        Affine forms are returned unchanged. If the argument is
+        neither an affine form, nor an interval, nor a scalar, an
+        interval.ScalarError is raised.
+        """
+        return x if isinstance(x, cls) else cls(x)
+
+    @property
+    def radius(self):
+        "An upper bound on the total deviation from the center."
+        return fpu.up(lambda: sum(abs(v) for v in self.terms.values()))
+
+    @property
+    def hull(self):
+        "The smallest interval enclosing all the values of the affine form."
+        r = self.radius
+        if not r:
+            return interval.new((interval.Component(self.center, self.center),))
+        return interval.new((interval.Component(
+            fpu.down(lambda: self.center - r),
+            fpu.up(lambda: self.center + r)),))
+
+    def __repr__(self):
+        return type(self).__name__ + '(' + ', '.join(
+            repr(x) for x in [self.center] + [self.terms[k] for k in sorted(self.terms)]) + ')'
+
+    def _coerce(f):
+        from functools import wraps
+
+        @wraps(f)
+        def wrapper(self, other):
+            try:
+                return f(self, self.cast(other))
+            except interval.ScalarError:
+                return NotImplemented
+        return wrapper
+
+    def __pos__(self):
+        return self
+
+    def __neg__(self):
+        return self.new(-self.center, dict((k, -v) for k, v in self.terms.items()))
+
+    @_coerce
+    def __add__(self, other):
+        def compute():
+            # In upward rounding, -((-a) - b) is a + b rounded downwards.
+            err = [0.0]
+
+            def add(a, b):
+                s = a + b
+                err[0] += s + ((-a) - b)
+                return s
+            terms = dict(self.terms)
+            for k, v in other.terms.items():
+                terms[k] = add(terms[k], v) if k in terms else v
+            return self.new(add(self.center, other.center), terms, err[0])
+        return fpu.up(compute)
+
+    def __radd__(self, other):
+        return self + other
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    def __rsub__(self, other):
+        return (-self) + other
+
+    @_coerce
+    def __mul__(self, other):
+        def compute():
+            # In upward rounding, -((-a) * b) is a * b rounded downwards.
+            err = [0.0]
+
+            def mul(a, b):
+                p = a * b
+                err[0] += p + (-a) * b
+                return p
+
+            def add(a, b):
+                s = a + b
+                err[0] += s + ((-a) - b)
+                return s
+            terms = dict((k, mul(other.center, v)) for k, v in self.terms.items())
+            for k, v in other.terms.items():
+                terms[k] = add(terms[k], mul(self.center, v)) if k in terms else mul(self.center, v)
+            center = mul(self.center, other.center)
+            if self.terms and other.terms:
+                err[0] += sum(abs(v) for v in self.terms.values()) * sum(abs(v) for v in other.terms.values())
+            return self.new(center, terms, err[0])
+        return fpu.up(compute)
+
+    def __rmul__(self, other):
+        return self * other
+
+    @_coerce
+    def __div__(self, other):
+        return self * reciprocal(other)
+
+    __truediv__ = __div__
+
+    @_coerce
+    def __rdiv__(self, other):
+        return other * reciprocal(self)
+
+    __rtruediv__ = __rdiv__
+
+    def __pow__(self, n):
+        if not fpu.isinteger(n):
+            return NotImplemented
+        if n < 0:
+            return reciprocal(self ** -n)
+        result, base = affine(1), self
+        while n:
+            n, bit = divmod(n, 2)
+            if bit:
+                result = result * base
+            if n:
+                base = base * base
+        return result
+
+    del _coerce
+
+
+def _residual(f, p, X, alpha):
+    """Enclose the range of f(x) - alpha * x over the interval X.
+
+    The interval X is split into three parts. Where the derivative of
+    the residual has constant sign, its range is spanned by its values
+    at the endpoints of the part, otherwise it is enclosed by its
+    centered form.
+    """
+    def g(x):
+        return f(x) - alpha * x
+
+    a, b = X[0]
+    points = [a, a / 3 * 2 + b / 3, a / 3 + b / 3 * 2, b]
+    parts = []
+    for u, v in zip(points, points[1:]):
+        piece = interval[u, v]
+        d = p(piece) - alpha
+        if d and (d[0].inf >= 0 or d[-1].sup <= 0):
+            parts.append(g(interval[u]) | g(interval[v]))
+        else:
+            m = piece.midpoint
+            parts.append(g(m) + d * (piece - m))
+    return interval.hull(parts)
+
+
+def linearize(f, p):
+    """Extend an interval function f to affine forms, given its derivative p.
+
+    Over the hull X of the argument, f(x) is written as alpha * x +
+    g(x), where alpha is the derivative at the midpoint of X. The
+    enclosure of g over X, computed piecewise from its monotonicity or
+    its centered form, becomes a new noise symbol. Where the
+    derivative is unbounded, the result is f(X) with a new noise
+    symbol. Arguments that are not affine forms are passed to f
+    unchanged:
+
+        >>> square = linearize(lambda x: x ** 2, lambda x: 2 * x)
+        >>> square(affine(interval[1, 3])).hull
+        interval([-0.2222222222222232, 9.0])
+        >>> square(interval[1, 3])
+        interval([1.0, 9.0])
+
+    """
+    from functools import wraps
+
+    @wraps(f)
+    def wrapper(x):
+        if not isinstance(x, affine):
+            return f(x)
+        X = x.hull
+        fX, dX = f(X), p(X)
+        if not fX:
+            raise affine.EmptyError("Argument outside of the domain")
+        if len(fX) == 1 and len(dX) == 1 and all(_isfinite(v) for v in dX[0] + X[0]):
+            dm = p(X.midpoint)
+            alpha = dm[0].inf / 2 + dm[-1].sup / 2 if dm else fpu.nan
+            if _isfinite(alpha):
+                g = _residual(f, p, X, alpha) & (fX - alpha * X)
+                if g:
+                    return alpha * x + affine(g)
+        return affine(interval.hull([fX]))
+    return wrapper
+
+
+reciprocal = linearize(lambda x: 1 / x, lambda x: -1 / x ** 2)
+reciprocal.__doc__ = "Reciprocal."
+
+exp = linearize(imath.exp, imath.exp)
+expm1 = linearize(imath.expm1, imath.exp)
+log = linearize(imath.log, lambda x: 1 / x)
+log2 = linearize(imath.log2, lambda x: 1 / (x * imath.log(2)))
+log10 = linearize(imath.log10, lambda x: 1 / (x * imath.log(10)))
+log1p = linearize(imath.log1p, lambda x: 1 / (1 + x))
+sqrt = linearize(imath.sqrt, lambda x: 1 / (2 * imath.sqrt(x)))
+atan = linearize(imath.atan, lambda x: 1 / (1 + x ** 2))
+atanpi = linearize(imath.atanpi, lambda x: 1 / (imath.pi * (1 + x ** 2)))
+sinh = linearize(imath.sinh, imath.cosh)
+cosh = linearize(imath.cosh, imath.sinh)
+tanh = linearize(imath.tanh, lambda x: 1 - imath.tanh(x) ** 2)
+sin = linearize(imath.sin, imath.cos)
+cos = linearize(imath.cos, lambda x: -imath.sin(x))
+tan = linearize(imath.tan, lambda x: 1 + imath.tan(x) ** 2)
+sinpi = linearize(imath.sinpi, lambda x: imath.pi * imath.cospi(x))
+cospi = linearize(imath.cospi, lambda x: -imath.pi * imath.sinpi(x))
+tanpi = linearize(imath.tanpi, lambda x: imath.pi * (1 + imath.tanpi(x) ** 2))
@@ -0,0 +1,265 @@
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+"""\
+``interval.contractor`` --- Forward-backward constraint propagation
+-------------------------------------------------------------------
+
+This module provides the HC4-revise contractor, which prunes a box
+with respect to a constraint f(x1, ..., xn) in target without
+bisecting it. The expression of f is recorded by calling it on
+symbolic variables; it is then evaluated forwards with interval
+arithmetic and projected backwards through the inverse of each
+operation:
+
+    >>> from interval import interval
+    >>> c = hc4(lambda x, y: x + y, interval[0, 1])
+    >>> c((interval[0, 5], interval[-1, 0.5]))
+    (interval([0.0, 2.0]), interval([-1.0, 0.5]))
+    >>> c = hc4(lambda x: exp(x) + 1, interval[2, 3])
+    >>> c((interval[-10, 10],))
+    (interval([0.0, 0.6931471805599454]),)
+
+The functions of this module, e.g., exp and log, record operations
+when applied to symbolic variables and delegate to ``interval.imath``
+otherwise, so that the same f can also be evaluated on intervals.
+"""
+
+import crlibm
+from . import interval, fpu, imath
+
+
+class expr(object):
+    """A node of an expression recorded on a tape.
+
+    The nodes are appended to the tape in the order in which they are
+    created, so that the arguments of a node always precede it.
+    """
+
+    __slots__ = ('tape', 'index', 'op', 'args', 'param')
+
+    def __init__(self, tape, op, args=(), param=None):
+        self.tape, self.op, self.args, self.param = tape, op, tuple(args), param
+        self.index = len(tape)
+        tape.append(self)
+
+    def _node(self, x):
+        if isinstance(x, expr):
+            return x
+        return expr(self.tape, 'const', param=interval.cast(x))
+
+    def _binary(op, swap=False):
+        def method(self, other):
+            try:
+                other = self._node(other)
+            except interval.ScalarError:
+                return NotImplemented
+            return expr(self.tape, op, (other, self) if swap else (self, other))
+        method.__name__ = op
+        return method
+
+    __add__ = _binary('add')
+    __radd__ = _binary('add', True)
+    __sub__ = _binary('sub')
+    __rsub__ = _binary('sub', True)
+    __mul__ = _binary('mul')
+    __rmul__ = _binary('mul', True)
+    __div__ = __truediv__ = _binary('div')
+    __rdiv__ = __rtruediv__ = _binary('div', True)
+
+    del _binary
+
+    def __pos__(self):
+        return self
+
+    def __neg__(self):
+        return expr(self.tape, 'neg', (self,))
+
+    def __pow__(self, n):
+        if not fpu.isinteger(n):
+            return NotImplemented
+        return expr(self.tape, 'pow', (self,), n)
+
+
+_positive = interval[0, fpu.infinity]
+
+
+def _root(z, n):
+    "Enclose the non-negative n-th roots of the non-negative part of z."
+    z = z & _positive
+    return imath.sqrt(z) if n == 2 else imath.exp(imath.log(z) / n)
+
+
+def _pow_inverse(z, x, n):
+    if n == 0:
+        return x if 1 in z else interval()
+    if n < 0:
+        z, n = 1 / z, -n
+    if n % 2:
+        return _root(z, n) | -_root(-z, n)
+    r = _root(z, n)
+    return r | -r
+
+
+def _periodic(x, base, period):
+    """The union of the translates of the intervals in base by multiples of period that meet x.
+
+    Return x if it is unbounded or spans too many periods.
+    """
+    if not x or not -fpu.infinity < x[0].inf <= x[-1].sup < fpu.infinity:
+        return x
+    p = period[0].inf
+    lo, hi = int(x[0].inf // p) - 1, int(x[-1].sup // p) + 2
+    if hi - lo > 16:
+        return x
+    return interval.union(b + k * period for k in range(lo, hi) for b in base)
+
+
+@interval.function
+def _asin(c):
+    c = (-1.0 if c.inf < -1 else c.inf, 1.0 if c.sup > 1 else c.sup)
+    return (crlibm.asin_rd(c[0]), crlibm.asin_ru(c[1])),
+
+
+@interval.function
+def _acos(c):
+    c = (-1.0 if c.inf < -1 else c.inf, 1.0 if c.sup > 1 else c.sup)
+    return (crlibm.acos_rd(c[1]), crlibm.acos_ru(c[0])),
+
+
+def _sin_inverse(z, x):
+    a = _asin(z & interval[-1, 1])
+    return _periodic(x, [a, imath.pi - a], 2 * imath.pi)
+
+
+def _cos_inverse(z, x):
+    a = _acos(z & interval[-1, 1])
+    return _periodic(x, [a, -a], 2 * imath.pi)
+
+
+_forward = {
+    'add': lambda n, x, y: x + y,
+    'sub': lambda n, x, y: x - y,
+    'mul': lambda n, x, y: x * y,
+    'div': lambda n, x, y: x / y,
+    'neg': lambda n, x: -x,
+    'pow': lambda n, x: x ** n,
+}
+
+_backward = {
+    'add': lambda z, n, x, y: (z - y, z - x),
+    'sub': lambda z, n, x, y: (z + y, x - z),
+    'mul': lambda z, n, x, y: (z / y, z / x),
+    'div': lambda z, n, x, y: (z * y, x / z),
+    'neg': lambda z, n, x: (-z,),
+    'pow': lambda z, n, x: (_pow_inverse(z, x, n),),
+    'exp': lambda z, n, x: (imath.log(z),),
+    'expm1': lambda z, n, x: (imath.log1p(z),),
+    'log': lambda z, n, x: (imath.exp(z),),
+    'log1p': lambda z, n, x: (imath.expm1(z),),
+    'sqrt': lambda z, n, x: ((z & _positive) ** 2,),
+    'sin': lambda z, n, x: (_sin_inverse(z, x),),
+    'cos': lambda z, n, x: (_cos_inverse(z, x),),
+}
+
+
+def _function(name):
+    f = getattr(imath, name)
+    _forward[name] = lambda n, x: f(x)
+
+    def wrapper(x):
+        if isinstance(x, expr):
+            return expr(x.tape, name, (x,))
+        return f(x)
+    wrapper.__name__ = name
+    wrapper.__doc__ = f.__doc__
+    return wrapper
+
+
+exp = _function('exp')
+expm1 = _function('expm1')
+log = _function('log')
+log1p = _function('log1p')
+sqrt = _function('sqrt')
+sin = _function('sin')
+cos = _function('cos')
+
+
+def _trace(f, n):
+    "Record f on a tape, returning the tape and the indices of its outputs."
+    tape = []
+    variables = [expr(tape, 'var', param=i) for i in range(n)]
+    outputs = f(*variables)
+    if not isinstance(outputs, (tuple, list)):
+        outputs = [outputs]
+    return tape, [variables[0]._node(y).index for y in outputs]
+
+
+def hc4(f, target, maxiter=10):
+    """Return the HC4-revise contractor for the constraint f(*box) in target.
+
+    The returned function accepts a box, i.e., a sequence of
+    intervals, and returns a tuple of intervals that contains all the
+    points of the box satisfying the constraint. If there are none, at
+    least one of the returned intervals is empty. Either f returns an
+    interval and target is an interval, or f returns a sequence of
+    intervals and target is a sequence of the same length.
+
+    Each revision consists of a forward evaluation of f followed by a
+    backward projection on the arguments. Revisions are repeated until
+    the box stops shrinking, or up to maxiter times:
+
+        >>> c = hc4(lambda x, y: (x * y, x - y), (interval[4], interval[3]))
+        >>> [x.format('%.4f') for x in c((interval[0, 10], interval[-1, 10]))]
+        ['interval([4.0000, 4.0000])', 'interval([1.0000, 1.0000])']
+
+    The function f is recorded on a tape the first time the contractor
+    is called and must not branch on the values of its arguments.
+    """
+    targets = [target] if isinstance(target, interval) else list(target)
+    traced = {}
+
+    def contract(box):
+        n = len(box)
+        if n not in traced:
+            traced[n] = _trace(f, n)
+        tape, outputs = traced[n]
+        box = tuple(interval.cast(x) for x in box)
+        for i in range(maxiter):
+            values = _revise(tape, outputs, targets, box)
+            if values is None:
+                return (interval(),) * n
+            if values == box:
+                break
+            box = values
+        return box
+    return contract
+
+
+def _revise(tape, outputs, targets, box):
+    "Perform a forward-backward pass, returning the new box, or None if it is empty."
+    values = []
+    for node in tape:
+        if node.op == 'var':
+            y = box[node.param]
+        elif node.op == 'const':
+            y = node.param
+        else:
+            y = _forward[node.op](node.param, *[values[a.index] for a in node.args])
+        if not y:
+            return None
+        values.append(y)
+    for i, t in zip(outputs, targets):
+        values[i] &= t
+        if not values[i]:
+            return None
+    for node in reversed(tape):
+        if not node.args:
+            continue
+        args = [values[a.index] for a in node.args]
+        for a, y in zip(node.args, _backward[node.op](values[node.index], node.param, *args)):
+            values[a.index] &= y
+            if not values[a.index]:
+                return None
+    return tuple(values[:len(box)])
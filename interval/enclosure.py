@@ -0,0 +1,180 @@
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+"""\
+``interval.enclosure`` --- Range enclosures by adaptive subdivision
+-------------------------------------------------------------------
+
+Evaluating a function over a wide interval usually overestimates its
+range, because every occurrence of the variable is treated as
+independent of the others:
+
+    >>> from interval import interval
+    >>> f = lambda x: x * (3 - x)
+    >>> f(interval[1, 2])
+    interval([1.0, 4.0])
+
+This module provides a routine that bisects the argument only where
+the enclosure is still too wide:
+
+    >>> range_enclosure(f, interval[1, 2], 1e-3).format('%.4f')
+    'interval([1.9995, 2.2510])'
+
+"""
+
+from . import interval, fpu
+
+
+def _bisect(c):
+    "Split a component at its midpoint, or return None if it cannot be split."
+    m = c.inf / 2 + c.sup / 2
+    if c.inf < m < c.sup:
+        return interval.Component(c.inf, m), interval.Component(m, c.sup)
+
+
+def _batched(f):
+    "Turn a function on intervals into a function on lists of intervals."
+    return lambda xs: [f(x) for x in xs]
+
+
+def _iswide(c):
+    "True if a component is bounded and not a single point."
+    return -fpu.infinity < c.inf < c.sup < fpu.infinity
+
+
+def centered(f, p, batch=False):
+    """Return the centered form of f, given an enclosure p of its derivative.
+
+    By the mean-value theorem, the range of f over a component c is
+    enclosed by f(m) + p(c) * (c - m) for any m in c. The returned
+    function evaluates this form at the midpoint of each bounded
+    component of its argument and intersects it with the naive
+    evaluation of f. The overestimation of the centered form shrinks
+    quadratically with the width of the component, rather than
+    linearly:
+
+        >>> f, p = lambda x: x * (3 - x), lambda x: 3 - 2 * x
+        >>> f(interval[1.4, 1.6])
+        interval([1.9599999999999997, 2.5600000000000005])
+        >>> centered(f, p)(interval[1.4, 1.6])
+        interval([2.2299999999999995, 2.2700000000000005])
+
+    With batch=True, f and p must accept and return lists of
+    intervals, and so does the returned function.
+    """
+    fs, ps = (f, p) if batch else (_batched(f), _batched(p))
+
+    def forms(xs):
+        parts = [[interval.new((c,)) for c in interval.cast(x)] for x in xs]
+        flat = [y for ys in parts for y in ys]
+        wide = [y for y in flat if _iswide(y[0])]
+        # Halving first cannot overflow, unlike the midpoint property
+        mids = [interval[y[0].inf / 2 + y[0].sup / 2] for y in wide]
+        values = fs(flat + mids)
+        slopes = iter(ps(wide))
+        anchors = iter(zip(mids, values[len(flat):]))
+        naive = iter(values)
+        result = []
+        for ys in parts:
+            z = []
+            for y in ys:
+                v = next(naive)
+                if _iswide(y[0]):
+                    m, fm = next(anchors)
+                    v = (fm + next(slopes) * (y - m)) & v
+                z.append(v)
+            result.append(interval.union(z))
+        return result
+
+    if batch:
+        return forms
+
+    from functools import wraps, WRAPPER_ASSIGNMENTS
+
+    # Callables such as functools.partial have no __name__, which
+    # wraps does not tolerate on Python 2.
+    @wraps(f, [a for a in WRAPPER_ASSIGNMENTS if hasattr(f, a)])
+    def wrapper(x):
+        return forms([x])[0]
+    return wrapper
+
+
+def _evaluator(f, cache, batch):
+    "Return a function evaluating f on a list of components through the cache."
+    def evaluate(components):
+        missing, seen = [], set()
+        for c in components:
+            if c not in cache and c not in seen:
+                missing.append(c)
+                seen.add(c)
+        if missing:
+            args = [interval.new((c,)) for c in missing]
+            results = f(args) if batch else [f(x) for x in args]
+            for c, y in zip(missing, results):
+                cache[c] = interval.cast(y)
+        return [cache[c] for c in components]
+    return evaluate
+
+
+def range_enclosure(f, x, tol, maxdepth=30, cache=None, batch=False, p=None):
+    """Enclose the range of f over x, bisecting x where needed.
+
+    The argument x is split into subintervals, called leaves, and the
+    result is the union of the evaluations of f over the leaves. At
+    every step the function is also evaluated at the midpoints of the
+    leaves, which yields an inner estimate of the range. A leaf is
+    bisected only if its enclosure exceeds the inner estimate by more
+    than tol, so that, unless maxdepth is reached, each bound of the
+    result is within tol of the corresponding bound of the true range.
+
+    Evaluations are stored in cache, a mapping from components to
+    intervals, which can be passed explicitly to share it across
+    calls with the same f and p:
+
+        >>> cache = {}
+        >>> f = lambda x: x ** 2 - x
+        >>> range_enclosure(f, interval[0, 2], 0.1, cache=cache)
+        interval([-0.3125, 2.03125])
+        >>> range_enclosure(f, interval[0, 2], 0.01, cache=cache)
+        interval([-0.259521484375, 2.00390625])
+
+    With batch=True, f is called once per step with the list of all
+    the intervals to be evaluated and must return the list of the
+    corresponding results:
+
+        >>> range_enclosure(lambda xs: [f(x) for x in xs], interval[0, 2], 0.01, batch=True)
+        interval([-0.259521484375, 2.00390625])
+
+    If an enclosure p of the derivative of f is provided, the leaves
+    are evaluated with the centered form of f, which requires far
+    fewer bisections:
+
+        >>> range_enclosure(f, interval[0, 2], 0.01, p=lambda x: 2 * x - 1)
+        interval([-0.2529296875, 2.0000038146972656])
+
+    """
+    if p is not None:
+        f = centered(f, p, batch)
+    evaluate = _evaluator(f, {} if cache is None else cache, batch)
+    leaves = [(c, 0) for c in interval.cast(x)]
+    lo, hi = fpu.infinity, -fpu.infinity
+    while True:
+        points = [interval.Component(m, m) for m in (c.inf / 2 + c.sup / 2 for c, d in leaves) if -fpu.infinity < m < fpu.infinity]
+        values = evaluate([c for c, d in leaves] + points)
+        enclosures = values[:len(leaves)]
+        for y in values[len(leaves):]:
+            if y:
+                lo, hi = fpu.min((lo, y[-1].sup)), fpu.max((hi, y[0].inf))
+        lo_tol, hi_tol = fpu.down(lambda: lo - tol), fpu.up(lambda: hi + tol)
+        refined, split = [], False
+        for (c, d), y in zip(leaves, enclosures):
+            halves = y and d < maxdepth and (y[0].inf < lo_tol or y[-1].sup > hi_tol) and _bisect(c)
+            if halves:
+                refined.extend((h, d + 1) for h in halves)
+                split = True
+            elif y:
+                refined.append((c, d))
+        leaves = refined
+        if not split:
+            return interval.union(evaluate([c for c, d in leaves]))
@@ -13,9 +13,14 @@ This module provides:
 
   2. Helper functions that respect IEEE 754 semantics.
 
-Limitations
-    The current implementation of the FPU's rounding-mode control is
-    thought to be not thread-safe.
+Threads
+    The rounding mode is part of the floating-point environment of
+    each thread, which the operating system saves and restores when
+    switching between threads. The functions up and down change the
+    rounding mode of the calling thread only, and restore it before
+    returning, also when interrupted by an exception. Interval
+    computations can therefore run concurrently in several threads,
+    e.g., with interval.threads.thread_map.
 
 """
 
@@ -28,18 +33,32 @@ def _init_libm():  # pragma: nocover
     "Initialize low-level FPU control using C99 primitives in libm."
     global _fe_upward, _fe_downward, _fegetround, _fesetround
 
-    import platform
-    processor = platform.processor()
-    if processor == 'powerpc':
+    # Unlike platform.processor, os.uname and platform.machine never
+    # spawn a subprocess
+    import os
+    try:
+        machine = os.uname()[4].lower()
+    except AttributeError:
+        import platform
+        machine = platform.machine().lower()
+    if machine.startswith(('ppc', 'powerpc', 'power')):
         _fe_upward, _fe_downward = 2, 3
-    elif processor == 'sparc':
+    elif machine.startswith(('sparc', 'sun4')):
         _fe_upward, _fe_downward = 0x80000000, 0xC0000000
+    elif machine.startswith(('arm', 'aarch64')):
+        _fe_upward, _fe_downward = 0x400000, 0x800000
     else:
         _fe_upward, _fe_downward = 0x0800, 0x0400
 
     from ctypes import cdll
-    from ctypes.util import find_library
-    libm = cdll.LoadLibrary(find_library('m'))
+    try:
+        # The interpreter is usually linked with libm already, which
+        # spares the search of find_library
+        libm = cdll.LoadLibrary(None)
+        libm.fegetround
+    except (AttributeError, OSError, TypeError):
+        from ctypes.util import find_library
+        libm = cdll.LoadLibrary(find_library('m'))
     _fegetround, _fesetround = libm.fegetround, libm.fesetround
 
 
@@ -154,16 +173,25 @@ else:              # pragma: PY2 only
         return isinstance(n, (int, long))
 
 
+_power_bits = {}
+
+
+def _bits(n):
+    "The binary digits of the non-negative integer n, most significant first."
+    try:
+        return _power_bits[n]
+    except KeyError:
+        bits = tuple(int(b) for b in bin(n)[2:]) if n else ()
+        if len(_power_bits) < 1024:
+            _power_bits[n] = bits
+        return bits
+
+
 def power_rn(x, n):
     "Raise x to the n-th power (with n positive integer), rounded to nearest."
     assert isinteger(n) and n >= 0
-    l = ()
-    while n > 0:
-        n, y = divmod(n, 2)
-        l = (y, l)
     result = 1.0
-    while l:
-        y, l = l
+    for y in _bits(n):
         if y:
             result = result * result * x
         else:
@@ -189,3 +217,34 @@ def power_rd(x, n):
         return - up(lambda: power_rn(-x, n))
     else:
         return down(lambda: power_rn(-x, n))
+
+
+def power_bounds(pairs, n):
+    """Return the list of (a ** n rounded down, b ** n rounded up) for the pairs (a, b).
+
+    The exponent n is a non-negative integer. All the bounds are
+    computed with a single switch of the rounding mode, as rounding
+    downwards -(-x * y) is x * y rounded upwards.
+    """
+    assert isinteger(n) and n >= 0
+    bits = _bits(n)
+    odd = n % 2
+
+    def lower(x):
+        r = 1.0
+        for y in bits:
+            r = r * r * x if y else r * r
+        return r
+
+    def upper(x):
+        r = 1.0
+        for y in bits:
+            r = -(-r * r * x) if y else -(-r * r)
+        return r
+
+    def bounds():
+        return [
+            (lower(a) if a >= 0 else -upper(-a) if odd else lower(-a),
+             upper(b) if b >= 0 else -lower(-b) if odd else upper(-b))
+            for a, b in pairs]
+    return down(bounds)
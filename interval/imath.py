@@ -18,9 +18,25 @@ except ImportError:
     del sys
 else:
 
-    from . import interval, fpu
+    from . import interval, fpu, memo
+
+    # The modules are included for compatibility with the star imports
+    # of the versions without __all__.
+    __all__ = [
+        'atan', 'atanpi', 'cos', 'cosh', 'cospi', 'crlibm', 'e', 'exp',
+        'expm1', 'fpu', 'interval', 'log', 'log10', 'log1p', 'log2', 'pi',
+        'pow', 'root', 'sin', 'sincos', 'sincospi', 'sinh', 'sinpi', 'sqrt',
+        'tan', 'tanh', 'tanpi']
 
     class monotonic(object):
+        """Decorator creating an interval function from a monotonically increasing one.
+
+        The function is evaluated on each component of the argument
+        clipped to the domain, the lower endpoint rounded down with rd
+        and the upper one rounded up with ru. The domain must be
+        connected.
+        """
+
         def __init__(self, domain=None, rd=None, ru=None):
             self.domain = domain or interval[-fpu.infinity, fpu.infinity]
             self.rd = rd
@@ -28,14 +44,34 @@ else:
 
         def __call__(self, f):
             from functools import wraps
-            self.rd = self.rd or getattr(crlibm, f.__name__ + '_rd')
-            self.ru = self.ru or getattr(crlibm, f.__name__ + '_ru')
+            rd = self.rd = self.rd or getattr(crlibm, f.__name__ + '_rd')
+            ru = self.ru = self.ru or getattr(crlibm, f.__name__ + '_ru')
+            lo, hi = self.domain[0]
+            component = interval.Component
+            new = interval.new
+
+            def image(c):
+                return (rd(c[0]), ru(c[1])),
 
             @wraps(f)
             def wrapper(x):
-                return interval._canonical(
-                    type(c)(self.rd(c.inf), self.ru(c.sup))
-                    for c in interval.cast(x) & self.domain)
+                if not isinstance(x, interval):
+                    x = interval.cast(x)
+                if len(x) == 1 and not memo.enabled:
+                    # Fast path for a single component within the domain
+                    a, b = x[0]
+                    if lo <= a and b <= hi:
+                        return new((component(rd(a), ru(b)),))
+                clipped = []
+                for a, b in x:
+                    a, b = max(a, lo), min(b, hi)
+                    if a <= b:
+                        clipped.append((a, b))
+                if memo.enabled:
+                    images = [t for c in clipped for t in memo.call(image, c)]
+                else:
+                    images = [(rd(a), ru(b)) for a, b in clipped]
+                return interval._canonical([component(*t) for t in images])
             return wrapper
 
     @monotonic()
@@ -84,8 +120,25 @@ else:
         else:
             return (1.0, fpu.max(crlibm.cosh_ru(x) for x in c)),
 
-    pi = 4 * atan(1)
-    e = exp(1)
+    # A lower bound of pi, which is all the trigonometric functions need
+    _pi_inf = 4 * crlibm.atan_rd(1.0)
+
+    def __getattr__(name):
+        "Compute the constants pi and e on first access."
+        if name == 'pi':
+            value = 4 * atan(1)
+        elif name == 'e':
+            value = exp(1)
+        else:
+            raise AttributeError("module %r has no attribute %r" % (__name__, name))
+        globals()[name] = value
+        return value
+
+    import sys
+    if sys.version_info < (3, 7):  # pragma: nocover
+        # Module-level __getattr__ is available only from Python 3.7
+        pi, e = __getattr__('pi'), __getattr__('e')
+    del sys
 
     def sqrt(x):
         "Square root."
@@ -95,6 +148,130 @@ else:
                 for e in c.extrema.components)
             for c in (x & interval[0, fpu.infinity]).components)
 
+    def _pow(a, b, c, d):
+        "Enclose x ** z for 0 <= a <= x <= b and c <= z <= d, with one rounding mode switch."
+        la, lb = crlibm.log_rd(a), crlibm.log_ru(b)
+
+        def bounds():
+            # Rounding downwards, -(-u * v) is u * v rounded upwards
+            lo, hi = fpu.infinity, -fpu.infinity
+            for u in (c, d):
+                for v in (la, lb):
+                    p, q = u * v, -(-u * v)
+                    if p != p:
+                        # 0 * inf, which is the limit of 0 * log(x)
+                        p = q = 0.0
+                    lo, hi = min(lo, p), max(hi, q)
+            return lo, hi
+        lo, hi = fpu.down(bounds)
+        return crlibm.exp_rd(lo), crlibm.exp_ru(hi)
+
+    def pow(x, y):
+        """Power with real or interval exponent.
+
+        The arguments with a positive base are raised to the exponent,
+        whereas those with a negative base are discarded unless the
+        exponent is an integer, in which case the result is x ** y:
+
+            >>> pow(interval[4, 9], 0.5)
+            interval([1.9999999999999998, 3.0000000000000004])
+            >>> pow(interval[-2, 3], interval[2])
+            interval([0.0, 9.0])
+
+        """
+        if not isinstance(x, interval):
+            x = interval.cast(x)
+        if fpu.isinteger(y):
+            return x ** y
+        y = [(y, y)] if isinstance(y, float) else interval.cast(y)
+        if len(y) == 1 and y[0][0] == y[0][1] == y[0][0] // 1:
+            return x ** int(y[0][0])
+        components = []
+        for a, b in x:
+            a = max(a, 0.0)
+            if a <= b:
+                components.extend(interval.Component(*_pow(a, b, c, d)) for c, d in y)
+        if len(components) == 1:
+            return interval.new(components)
+        return interval._canonical(components)
+
+    def root(x, n):
+        """The n-th root, for a non-zero integer n.
+
+        Odd roots are defined on the whole real line, even roots on the
+        non-negative numbers only. The roots of numbers that are exact
+        powers are exact:
+
+            >>> root(interval([-27, -8], [16, 81]), 3)
+            interval([-3.0, -2.0], [2.519842099789746, 4.326748710922225])
+            >>> root(interval[-1, 16], 4)
+            interval([0.0, 2.0])
+
+        The bounds are approximations of the roots rounded to nearest,
+        verified by raising them to the n-th power with directed
+        rounding. Should the verification fail, the bounds are computed
+        from the logarithm instead.
+        """
+        if not fpu.isinteger(n) or n == 0:
+            raise ValueError("The order of a root must be a non-zero integer")
+        if n < 0:
+            return root(x, -n).inverse()
+        if not isinstance(x, interval):
+            x = interval.cast(x)
+        if n == 1:
+            return x
+        e = 1.0 / n
+
+        def candidates(m, upper):
+            "Approximations of the root of m >= 0, with the nearest float first."
+            if m == 0 or m == fpu.infinity:
+                return m,
+            r = m ** e
+            try:
+                r += (m / r ** (n - 1) - r) / n
+            except (OverflowError, ZeroDivisionError):
+                pass
+            return r, r * (1 + 2 ** -52) if upper else r * (1 - 2 ** -52)
+
+        def verified(magnitudes, upper):
+            "Bounds of the roots of the magnitudes, or None where the verification fails."
+            tests = [candidates(m, upper) for m in magnitudes]
+
+            def verify():
+                found = []
+                for m, cs in zip(magnitudes, tests):
+                    for c in cs:
+                        p = fpu.power_rn(c, n)
+                        if p >= m if upper else p <= m:
+                            found.append(c)
+                            break
+                    else:
+                        found.append(None)
+                return found
+            found = (fpu.down if upper else fpu.up)(verify)
+            if None in found:
+                y = fpu.down(lambda: 1.0 / n), fpu.up(lambda: 1.0 / n)
+                found = [c if c is not None else _pow(m, m, y[0], y[1])[upper] for m, c in zip(magnitudes, found)]
+            return found
+
+        endpoints = []
+        for a, b in x:
+            if not n % 2:
+                a = max(a, 0.0)
+            if a <= b:
+                endpoints += a, b
+        # The lower bound of the root of a negative number is the
+        # opposite of the upper bound of the root of its magnitude.
+        upper = [(i % 2 == 1) == (v >= 0) for i, v in enumerate(endpoints)]
+        bounds = dict(
+            (flag, iter(verified([abs(v) for v, u in zip(endpoints, upper) if u == flag], flag)))
+            for flag in (True, False) if flag in upper)
+        roots = [next(bounds[u]) if v >= 0 else -next(bounds[u]) for v, u in zip(endpoints, upper)]
+        components = [interval.Component(a, b) for a, b in zip(roots[::2], roots[1::2])]
+        if len(components) == 1:
+            return interval.new(components)
+        return interval._canonical(components)
+
     def tanh():
         one_rd = crlibm.log_rd(crlibm.exp_rd(1))
 
@@ -125,41 +302,77 @@ else:
         return tanh
     tanh = tanh()
 
+    def _sincos(c, sin_rd, sin_ru, cos_rd, cos_ru, half):
+        """The bounds of the sine and cosine of a component, for a half period half.
+
+        Each of the four functions is evaluated at most once per endpoint.
+        """
+        d = fpu.up(lambda: c.sup - c.inf)
+        if d != d or d >= 2.0 * half:
+            return (-1.0, +1.0), (-1.0, +1.0)
+        # The endpoints are finite, hence none of the values is nan
+        s = [(sin_rd(x), sin_ru(x)) for x in c]
+        k = [(cos_rd(x), cos_ru(x)) for x in c]
+        # The derivative of the sine is the cosine, that of the cosine
+        # is minus the sine. A change of sign of the derivative between
+        # the endpoints locates an extremum.
+        if k[0][0] <= 0 <= k[1][1]:
+            sine = (-1.0, max(s[0][1], s[1][1]))
+        elif k[0][1] >= 0 >= k[1][0]:
+            sine = (min(s[0][0], s[1][0]), +1.0)
+        elif d >= half:
+            sine = (-1.0, +1.0)
+        else:
+            sine = (min(s[0][0], s[1][0]), max(s[0][1], s[1][1]))
+        if s[0][0] <= 0 <= s[1][1]:
+            cosine = (min(k[0][0], k[1][0]), +1.0)
+        elif s[0][1] >= 0 >= s[1][0]:
+            cosine = (-1.0, max(k[0][1], k[1][1]))
+        elif d >= half:
+            cosine = (-1.0, +1.0)
+        else:
+            cosine = (min(k[0][0], k[1][0]), max(k[0][1], k[1][1]))
+        return sine, cosine
+
+    def _sincos_pi(c):
+        return _sincos(c, crlibm.sinpi_rd, crlibm.sinpi_ru, crlibm.cospi_rd, crlibm.cospi_ru, 1.0)
+
+    def _sincos_rad(c):
+        return _sincos(c, crlibm.sin_rd, crlibm.sin_ru, crlibm.cos_rd, crlibm.cos_ru, _pi_inf)
+
+    def _fused(sincos):
+        "Create a function returning the pair of intervals computed by sincos on each component."
+        def fused(x):
+            if not isinstance(x, interval):
+                x = interval.cast(x)
+            pairs = [memo.call(sincos, c) if memo.enabled else sincos(c) for c in x]
+            if len(pairs) == 1:
+                return tuple(interval.new((interval.Component(*p),)) for p in pairs[0])
+            return tuple(interval._canonical([interval.Component(*p[i]) for p in pairs]) for i in (0, 1))
+        return fused
+
     @interval.function
     def cospi(c):
         "cos(pi*x)."
-        d = fpu.up(lambda: c.sup - c.inf)
-        if d != d or d >= 2.0:
-            return (-1.0, +1.0),
-        inf = fpu.min(crlibm.cospi_rd(x) for x in c)
-        sup = fpu.max(crlibm.cospi_ru(x) for x in c)
-        # The derivative of cospi is -pi*sinpi. As we are interested in the
-        # derivative sign but not its magnitude, we omit the pi factor.
-        if crlibm.sinpi_rd(c.inf) <= 0 <= crlibm.sinpi_ru(c.sup):
-            return (inf, +1.0),
-        if crlibm.sinpi_ru(c.inf) >= 0 >= crlibm.sinpi_rd(c.sup):
-            return (-1.0, sup),
-        if d >= 1.0:
-            return (-1.0, +1.0),
-        return (inf, sup),
+        return _sincos_pi(c)[1],
 
     @interval.function
     def sinpi(c):
         "sin(pi*x)."
-        d = fpu.up(lambda: c.sup - c.inf)
-        if d != d or d >= 2.0:
-            return (-1.0, +1.0),
-        inf = fpu.min(crlibm.sinpi_rd(x) for x in c)
-        sup = fpu.max(crlibm.sinpi_ru(x) for x in c)
-        # The derivative of sinpi is pi*cospi. As we are interested in the
-        # derivative sign but not its magnitude, we omit the pi factor.
-        if crlibm.cospi_rd(c.inf) <= 0 <= crlibm.cospi_ru(c.sup):
-            return (-1.0, sup),
-        if crlibm.cospi_ru(c.inf) >= 0 >= crlibm.cospi_rd(c.sup):
-            return (inf, +1.0),
-        if d >= 1.0:
-            return (-1.0, +1.0),
-        return (inf, sup),
+        return _sincos_pi(c)[0],
+
+    def sincospi(x):
+        """Return the pair sinpi(x), cospi(x).
+
+        The values at the endpoints of each component are computed only
+        once for both functions:
+
+            >>> sincospi(interval[0.25, 0.5])
+            (interval([0.7071067811865475, 1.0]), interval([-0.0, 0.7071067811865476]))
+
+        """
+        return _fused_pi(x)
+    _fused_pi = _fused(_sincos_pi)
 
     @interval.function
     def tanpi(c):
@@ -179,40 +392,33 @@ else:
     @interval.function
     def cos(c):
         "Cosine."
-        d = fpu.up(lambda: c.sup - c.inf)
-        if d != d or d >= 2.0 * pi[0].inf:
-            return (-1.0, +1.0),
-        inf = fpu.min(crlibm.cos_rd(x) for x in c)
-        sup = fpu.max(crlibm.cos_ru(x) for x in c)
-        if crlibm.sin_rd(c.inf) <= 0 <= crlibm.sin_ru(c.sup):
-            return (inf, +1.0),
-        if crlibm.sin_ru(c.inf) >= 0 >= crlibm.sin_rd(c.sup):
-            return (-1.0, sup),
-        if d >= pi[0].inf:
-            return (-1.0, +1.0),
-        return (inf, sup),
+        return _sincos_rad(c)[1],
 
     @interval.function
     def sin(c):
         "Sine."
-        d = fpu.up(lambda: c.sup - c.inf)
-        if d != d or d >= 2.0 * pi[0].inf:
-            return (-1.0, +1.0),
-        inf = fpu.min(crlibm.sin_rd(x) for x in c)
-        sup = fpu.max(crlibm.sin_ru(x) for x in c)
-        if crlibm.cos_rd(c.inf) <= 0 <= crlibm.cos_ru(c.sup):
-            return (-1.0, sup),
-        if crlibm.cos_ru(c.inf) >= 0 >= crlibm.cos_rd(c.sup):
-            return (inf, +1.0),
-        if d >= pi[0].inf:
-            return (-1.0, +1.0),
-        return (inf, sup),
+        return _sincos_rad(c)[0],
+
+    def sincos(x):
+        """Return the pair sin(x), cos(x).
+
+        The values at the endpoints of each component are computed only
+        once for both functions, which takes about half the time of
+        calling them separately:
+
+            >>> s, c = sincos(interval[0, 1])
+            >>> s.format('%.4f'), c.format('%.4f')
+            ('interval([0.0000, 0.8415])', 'interval([0.5403, 1.0000])')
+
+        """
+        return _fused_rad(x)
+    _fused_rad = _fused(_sincos_rad)
 
     @interval.function
     def tan(c):
         "Tangent."
         d = fpu.up(lambda: c.sup - c.inf)
-        if d != d or d >= pi[0].inf:
+        if d != d or d >= _pi_inf:
             return (-fpu.infinity, +fpu.infinity),
         if 0.0 in cos(interval.new((c,))):
             def denan(x, ifnan):
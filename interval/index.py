@@ -0,0 +1,142 @@
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+"""\
+``interval.index`` --- Searching collections of intervals
+---------------------------------------------------------
+
+This module provides an index of a collection of intervals, which
+finds the intervals that contain a point or that overlap another
+interval without scanning the whole collection:
+
+    >>> from interval import interval
+    >>> catalog = IntervalIndex([interval[0, 10], interval([2, 3], [7, 8]), interval[5, 6]])
+    >>> catalog.stab(7.5)
+    [0, 1]
+    >>> catalog.overlap(interval[3, 5])
+    [0, 1, 2]
+
+The results are the positions of the intervals in the order in which
+they were added to the index.
+"""
+
+from array import array
+from bisect import bisect_right
+from . import interval, fpu
+
+
+class _block(object):
+    """A static set of components, sorted by lower bound.
+
+    The upper bounds are stored in the leaves of a complete binary
+    tree whose inner nodes hold the maximum of their children, so that
+    the components of a prefix with an upper bound above a threshold
+    are found by visiting only the subtrees that contain some.
+    """
+
+    def __init__(self, components):
+        components.sort()
+        self.components = components
+        self.infs = array('d', [c[0] for c in components])
+        n = len(components)
+        m = 1
+        while m < n:
+            m *= 2
+        tree = array('d', [-fpu.infinity]) * (2 * m)
+        tree[m:m + n] = array('d', [c[1] for c in components])
+        for k in range(m - 1, 0, -1):
+            tree[k] = max(tree[2 * k], tree[2 * k + 1])
+        self.leaves, self.tree = m, tree
+
+    def __len__(self):
+        return len(self.components)
+
+    def search(self, inf, sup, result):
+        "Add to result the entries of the components [a, b] with a <= sup and b >= inf."
+        stop = bisect_right(self.infs, sup)
+        tree, m = self.tree, self.leaves
+        stack = [(1, 0, m)] if stop else []
+        while stack:
+            k, lo, width = stack.pop()
+            if tree[k] < inf:
+                continue
+            if k >= m:
+                result.add(self.components[lo][2])
+                continue
+            width //= 2
+            if lo + width < stop:
+                stack.append((2 * k + 1, lo + width, width))
+            stack.append((2 * k, lo, width))
+
+
+class IntervalIndex(object):
+    """An index of a sequence of intervals supporting stabbing and overlap queries.
+
+    The index is built in bulk from an iterable of intervals, and
+    grows by insertion:
+
+        >>> index = IntervalIndex()
+        >>> index.add(interval[1, 2])
+        0
+        >>> index.extend([interval[2, 4], interval(5, 7)])
+        >>> index.stab(2), index.stab(6), len(index), index[2]
+        ([0, 1], [], 3, interval([5.0], [7.0]))
+
+    Each query takes a time logarithmic in the number of components
+    in the index, plus a time proportional to the number of results.
+    The components of the intervals added one at a time are kept in
+    blocks whose sizes decrease geometrically, which are rebuilt as
+    they are merged.
+    """
+
+    def __init__(self, intervals=()):
+        self._intervals = []
+        self._blocks = []
+        self.extend(intervals)
+
+    def __len__(self):
+        return len(self._intervals)
+
+    def __getitem__(self, i):
+        return self._intervals[i]
+
+    def __iter__(self):
+        return iter(self._intervals)
+
+    def add(self, x):
+        "Add an interval to the index, returning its position."
+        i = len(self._intervals)
+        self._insert([x])
+        return i
+
+    def extend(self, intervals):
+        "Add all the intervals of an iterable to the index."
+        self._insert(intervals)
+
+    def _insert(self, intervals):
+        start = len(self._intervals)
+        self._intervals.extend(interval.cast(x) for x in intervals)
+        components = [(c.inf, c.sup, i) for i in range(start, len(self._intervals)) for c in self._intervals[i]]
+        if not components:
+            return
+        blocks = self._blocks
+        blocks.append(_block(components))
+        while len(blocks) > 1 and len(blocks[-2]) <= 2 * len(blocks[-1]):
+            last = blocks.pop()
+            blocks[-1] = _block(blocks[-1].components + last.components)
+
+    def _search(self, x):
+        result = set()
+        for c in x:
+            for b in self._blocks:
+                b.search(c.inf, c.sup, result)
+        return sorted(result)
+
+    def stab(self, p):
+        "Return the sorted positions of the intervals that contain the point p."
+        return self._search(interval.cast(p))
+
+    def overlap(self, x):
+        "Return the sorted positions of the intervals that intersect the interval x."
+        return self._search(interval.cast(x))
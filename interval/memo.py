@@ -0,0 +1,112 @@
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+"""\
+``interval.memo`` --- Caching of interval functions
+---------------------------------------------------
+
+This module controls a cache of the values of the functions created
+with interval.function and of the imath functions, on each component
+of their arguments. The cache is disabled by default. When enabled, it
+holds up to maxsize values, and discards the least recently used ones
+first:
+
+    >>> from interval import interval, imath
+    >>> enable(maxsize=1000)
+    >>> x = imath.exp(interval[1, 2]) + imath.exp(interval([1, 2], 3))
+    >>> info()
+    CacheInfo(hits=1, misses=2, maxsize=1000, currsize=2)
+    >>> disable()
+
+The cache is shared by all the functions and threads. Components with
+a zero endpoint bypass the cache, as some functions depend on the sign
+of zero.
+"""
+
+import threading
+from collections import namedtuple
+
+CacheInfo = namedtuple('CacheInfo', 'hits misses maxsize currsize')
+
+enabled = False
+_maxsize = 0
+# The cache maps each key to a link [previous, next, key, result] of a
+# circular doubly linked list, ordered from the least to the most
+# recently used, which starts and ends at _root. OrderedDict is not
+# available on Python 2.6.
+_cache = {}
+_root = []
+_root[:] = [_root, _root, None, None]
+_lock = threading.Lock()
+_hits = _misses = 0
+
+
+def _trim(maxsize):
+    "Discard the least recently used values beyond maxsize."
+    while len(_cache) > maxsize:
+        oldest = _root[1]
+        _root[1], oldest[1][0] = oldest[1], _root
+        del _cache[oldest[2]]
+
+
+def enable(maxsize=65536):
+    "Enable the cache, with room for maxsize values."
+    global enabled, _maxsize
+    with _lock:
+        _maxsize = maxsize
+        _trim(maxsize)
+        enabled = maxsize > 0
+
+
+def disable():
+    "Disable and clear the cache."
+    global enabled
+    enabled = False
+    clear()
+
+
+def clear():
+    "Discard the cached values and reset the statistics."
+    global _hits, _misses
+    with _lock:
+        _cache.clear()
+        _root[:] = [_root, _root, None, None]
+        _hits = _misses = 0
+
+
+def info():
+    "Return the statistics of the cache."
+    return CacheInfo(_hits, _misses, _maxsize, len(_cache))
+
+
+def call(f, c):
+    """Return the tuple of the components of f(c), looking it up in the cache first.
+
+    The argument c is a component, and f returns a sequence of
+    components.
+    """
+    global _hits, _misses
+    if c[0] == 0 or c[1] == 0:
+        return f(c)
+    key = (f, c[0], c[1])
+    with _lock:
+        link = _cache.get(key)
+        if link is not None:
+            # Move the link to the most recently used end
+            previous, following = link[0], link[1]
+            previous[1], following[0] = following, previous
+            last = _root[0]
+            last[1] = _root[0] = link
+            link[0], link[1] = last, _root
+            _hits += 1
+            return link[3]
+        _misses += 1
+    result = tuple(f(c))
+    with _lock:
+        if key not in _cache:
+            last = _root[0]
+            link = [last, _root, key, result]
+            last[1] = _root[0] = _cache[key] = link
+            _trim(_maxsize)
+    return result
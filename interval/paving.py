@@ -0,0 +1,239 @@
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+"""\
+``interval.paving`` --- Set inversion
+-------------------------------------
+
+This module computes the set of the arguments of a function whose
+images lie within a target interval, using the SIVIA algorithm (Set
+Inversion Via Interval Analysis). For instance, the points of the
+plane within the ring 1 <= x**2 + y**2 <= 4 are found with
+
+    >>> from interval import interval
+    >>> p = sivia(lambda x, y: x ** 2 + y ** 2, (interval[-3, 3], interval[-3, 3]), interval[1, 4], maxdepth=10)
+    >>> p.classify((1.5, 0)) == paving.INSIDE, p.classify((0, 0)) == paving.OUTSIDE
+    (True, True)
+
+The result is a paving: a binary tree of boxes stored in flat arrays,
+which is cheap to keep in memory, to query and to serialize.
+"""
+
+import struct
+import sys
+from array import array
+from . import interval
+
+
+class paving(object):
+    """A paving of a box, i.e., a binary tree of boxes classified as
+    inside, outside or on the boundary of a set.
+
+    A box is a tuple of intervals with one component each. Each node
+    of the tree is either a leaf, labelled with INSIDE, OUTSIDE or
+    BOUNDARY, or it is split in two along a dimension at a point. The
+    nodes are stored in three arrays: for the n-th node, kind[n] is
+    the label of a leaf, or the dimension of a split; point[n] is the
+    point of a split; child[n] is the index of the first of two
+    consecutive children of a split.
+
+        >>> p = paving((interval[0, 2], interval[0, 1]))
+        >>> left, right = p.split(0, 0, 1.0)
+        >>> p.kind[right] = paving.INSIDE
+        >>> [(box, label == paving.INSIDE) for box, label in p.boxes()]
+        [((interval([0.0, 1.0]), interval([0.0, 1.0])), False), ((interval([1.0, 2.0]), interval([0.0, 1.0])), True)]
+
+    """
+
+    OUTSIDE, BOUNDARY, INSIDE = -1, -2, -3
+
+    _magic = b'PAVE'
+    _header = struct.Struct('<4sII')
+
+    def __init__(self, box):
+        self.box = tuple(interval.hull([interval.cast(x)]) for x in box)
+        self.kind = array('i', [self.BOUNDARY])
+        self.point = array('d', [0.0])
+        self.child = array('i', [0])
+
+    def __len__(self):
+        "The number of nodes."
+        return len(self.kind)
+
+    def split(self, n, dim, point):
+        "Split the n-th node along a dimension, returning the indices of the two children."
+        self.kind[n], self.point[n], self.child[n] = dim, point, len(self.kind)
+        self.kind.extend((self.BOUNDARY, self.BOUNDARY))
+        self.point.extend((0.0, 0.0))
+        self.child.extend((0, 0))
+        return self.child[n], self.child[n] + 1
+
+    def boxes(self, label=None):
+        """Iterate on the pairs (box, label) of the leaves.
+
+        If label is specified, iterate only on the boxes of the leaves
+        with that label.
+        """
+        stack = [(0, self.box)]
+        while stack:
+            n, box = stack.pop()
+            kind = self.kind[n]
+            if kind < 0:
+                if label is None:
+                    yield box, kind
+                elif kind == label:
+                    yield box
+                continue
+            c, p = box[kind][0], self.point[n]
+            stack.append((self.child[n] + 1, box[:kind] + (interval[p, c.sup],) + box[kind + 1:]))
+            stack.append((self.child[n], box[:kind] + (interval[c.inf, p],) + box[kind + 1:]))
+
+    def classify(self, point):
+        """Return the label of the leaf containing the point.
+
+        A point on the boundary between leaves with different labels
+        is classified as INSIDE if any of them is, otherwise as
+        BOUNDARY if any of them is. A point outside the box is
+        OUTSIDE.
+        """
+        if not all(x[0].inf <= y <= x[0].sup for x, y in zip(self.box, point)):
+            return self.OUTSIDE
+        result, stack = self.OUTSIDE, [0]
+        while stack:
+            n = stack.pop()
+            kind = self.kind[n]
+            if kind < 0:
+                result = min(result, kind)
+                continue
+            if point[kind] <= self.point[n]:
+                stack.append(self.child[n])
+            if point[kind] >= self.point[n]:
+                stack.append(self.child[n] + 1)
+        return result
+
+    def to_bytes(self):
+        "Serialize the paving into a byte string."
+        arrays = [array('d', [c for x in self.box for c in x[0]]), self.kind, self.point, self.child]
+        if sys.byteorder == 'big':  # pragma: nocover
+            arrays = [array(a.typecode, a) for a in arrays]
+            for a in arrays:
+                a.byteswap()
+        return self._header.pack(self._magic, len(self.box), len(self)) + b''.join(_tobytes(a) for a in arrays)
+
+    @classmethod
+    def from_bytes(cls, data):
+        "Deserialize a paving from a byte string created by to_bytes."
+        magic, ndim, size = cls._header.unpack_from(data)
+        if magic != cls._magic:
+            raise ValueError("Invalid paving data")
+        arrays = [array(code) for code in 'didi']
+        offset = cls._header.size
+        for a, n in zip(arrays, (2 * ndim, size, size, size)):
+            end = offset + n * a.itemsize
+            _frombytes(a, data[offset:end])
+            offset = end
+        if sys.byteorder == 'big':  # pragma: nocover
+            for a in arrays:
+                a.byteswap()
+        bounds, kind, point, child = arrays
+        self = cls([interval[bounds[i], bounds[i + 1]] for i in range(0, 2 * ndim, 2)])
+        self.kind, self.point, self.child = kind, point, child
+        return self
+
+
+try:
+    array('b').tobytes
+except AttributeError:  # pragma: PY2 only
+    _tobytes, _frombytes = array.tostring, array.fromstring
+else:                   # pragma: PY3 only
+    _tobytes, _frombytes = array.tobytes, array.frombytes
+
+
+def _classify(args):
+    """Contract and classify a box.
+
+    The argument is a tuple (f, target, contractor, box). Return the
+    contracted box, or None if it is empty, and its label.
+    """
+    f, target, contractor, box = args
+    if contractor is not None:
+        box = contractor(box)
+        if not all(box):
+            return None, paving.OUTSIDE
+        box = tuple(interval.hull([x]) for x in box)
+    if isinstance(target, interval):
+        ys, targets = [f(*box)], [target]
+    else:
+        ys, targets = f(*box), target
+    ys = [interval.cast(y) for y in ys]
+    if not all(ys) or any(not (y & t) for y, t in zip(ys, targets)):
+        return box, paving.OUTSIDE
+    if all(y in t for y, t in zip(ys, targets)):
+        return box, paving.INSIDE
+    return box, paving.BOUNDARY
+
+
+def _carve(result, n, box, contracted):
+    "Split off the parts of box outside of the contracted box, returning the remaining node."
+    for dim, (x, y) in enumerate(zip(box, contracted)):
+        if y[0].inf > x[0].inf:
+            left, n = result.split(n, dim, y[0].inf)
+            result.kind[left] = paving.OUTSIDE
+        if y[0].sup < x[0].sup:
+            n, right = result.split(n, dim, y[0].sup)
+            result.kind[right] = paving.OUTSIDE
+    return n
+
+
+def sivia(f, box, target, eps=0.0, maxdepth=20, contractor=None, pool=None):
+    """Compute the paving of the set of the points of box whose image under f lies within target.
+
+    The function f accepts as many intervals as the dimensions of
+    box. Either f returns an interval and target is an interval, or f
+    returns a sequence of intervals and target is a sequence of the
+    same length, in which case all the images must lie within the
+    respective targets.
+
+    Starting from box, each box is classified as INSIDE if its image
+    lies within the target, OUTSIDE if it does not intersect the
+    target, and otherwise it is bisected along its widest dimension,
+    unless its width is at most eps or it is the result of maxdepth
+    bisections, in which case it is classified as BOUNDARY.
+
+    If a contractor is specified, it is applied to every box before
+    its classification: it must return a sub-box that contains all the
+    points of the set in the original box. The parts removed by the
+    contractor are recorded as OUTSIDE, except for the faces they share
+    with the contracted box.
+
+    The boxes are processed in batches, one per level of the tree,
+    which can be evaluated on a pool of workers, e.g., a
+    multiprocessing.Pool. In this case f and the contractor must be
+    picklable.
+    """
+    mapper = map if pool is None else pool.map
+    result = paving(box)
+    work = [(0, result.box, 0)]
+    while work:
+        classified = mapper(_classify, [(f, target, contractor, b) for n, b, d in work])
+        pending = []
+        for (n, b, depth), (c, label) in zip(work, classified):
+            if c is None:
+                result.kind[n] = label
+                continue
+            n = _carve(result, n, b, c)
+            result.kind[n] = label
+            if label != paving.BOUNDARY or depth >= maxdepth:
+                continue
+            widths = [x[0].sup - x[0].inf for x in c]
+            dim = widths.index(max(widths))
+            x = c[dim][0]
+            m = x.inf / 2 + x.sup / 2
+            if widths[dim] <= eps or not x.inf < m < x.sup:
+                continue
+            left, right = result.split(n, dim, m)
+            pending.append((left, c[:dim] + (interval[x.inf, m],) + c[dim + 1:], depth + 1))
+            pending.append((right, c[:dim] + (interval[m, x.sup],) + c[dim + 1:], depth + 1))
+        work = pending
+    return result
@@ -0,0 +1,401 @@
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+"""\
+``interval.polynomial`` --- Polynomials with interval evaluation
+----------------------------------------------------------------
+
+This module provides the polynomial class, whose coefficients are
+numbers or intervals, listed from the constant term up:
+
+    >>> p = polynomial([1, -2, 0, 1])
+    >>> p
+    polynomial([1, -2, 0, 1])
+
+Polynomials are evaluated on intervals by Horner's scheme, with all
+the bounds computed under a single rounding mode switch, or with the
+Taylor form at the midpoint, which is much tighter on narrow
+arguments:
+
+    >>> from interval import interval
+    >>> x = interval[0.5, 0.7]
+    >>> x ** 3 - 2 * x + 1
+    interval([-0.2749999999999999, 0.3430000000000001])
+    >>> p(x)
+    interval([-0.2250000000000001, 0.245])
+    >>> p.centered(x)
+    interval([-0.07700000000000011, 0.12700000000000014])
+
+The real roots of polynomials with numeric coefficients are isolated
+in exact arithmetic and then refined with the interval Newton method:
+
+    >>> p.roots()
+    interval([-1.618033988749895, -1.6180339887498947], [0.6180339887498948, 0.6180339887498949], [1.0])
+
+"""
+
+from fractions import Fraction
+from . import interval, fpu
+
+
+def _enclose(q):
+    "The tightest interval containing the rational number q."
+    x = float(q)
+    if Fraction(x) == q:
+        return x, x
+    if Fraction(x) < q:
+        return x, fpu.up(lambda: x + abs(x) * 2 ** -53) if x else 5e-324
+    return fpu.down(lambda: x - abs(x) * 2 ** -53) if x else -5e-324, x
+
+
+def _exact(c):
+    "The coefficient c as a Fraction, or None if it is not a single number."
+    if isinstance(c, interval):
+        if len(c) == 1 and c[0].inf == c[0].sup:
+            c = c[0].inf
+        else:
+            return None
+    try:
+        return Fraction(c)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def _mul(a, b, c, d):
+    "The bounds of [a, b] * [c, d], when rounding downwards."
+    # Rounding downwards, -(-x * y) is x * y rounded upwards
+    return (min(a * c, a * d, b * c, b * d),
+            -min(-a * c, -a * d, -b * c, -b * d))
+
+
+def _horner(bounds, a, b):
+    "Enclose the polynomial with coefficients bounds, highest first, over [a, b], when rounding downwards."
+    lo, hi = bounds[0]
+    for clo, chi in bounds[1:]:
+        lo, hi = _mul(lo, hi, a, b)
+        lo, hi = lo + clo, -(-hi - chi)
+    return lo, hi
+
+
+def _shift(q, s):
+    "The coefficients, lowest first, of q(x + s)."
+    q = list(q)
+    for i in range(len(q) - 1):
+        for j in range(len(q) - 2, i - 1, -1):
+            q[j] += s * q[j + 1]
+    return q
+
+
+def _variations(q):
+    "The number of sign changes in a sequence, ignoring zeros."
+    signs = [x > 0 for x in q if x]
+    return sum(1 for s, t in zip(signs, signs[1:]) if s != t)
+
+
+def _value(q, x):
+    "The exact value of the polynomial with coefficients q, lowest first, at x."
+    v = 0
+    for c in reversed(q):
+        v = v * x + c
+    return v
+
+
+def _sign(x):
+    return (x > 0) - (x < 0)
+
+
+def _sign_at(q, x):
+    "The sign of the polynomial with integer coefficients q, lowest first, at the float x."
+    n, d = x.as_integer_ratio()
+    v, power = 0, 1
+    for c in reversed(q):
+        v = v * n + c * power
+        power *= d
+    return _sign(v)
+
+
+def _newton(bounds, dbounds, lo, m, hi):
+    """The interval Newton step on [lo, hi] from m, when rounding downwards.
+
+    The polynomial and its derivative have coefficients bounds and
+    dbounds. Return None if the derivative is not bounded away from
+    zero.
+    """
+    flo, fhi = _horner(bounds, m, m)
+    dlo, dhi = _horner(dbounds, lo, hi)
+    if not (dlo > 0 or dhi < 0):
+        return None
+    qlo = min(flo / dlo, flo / dhi, fhi / dlo, fhi / dhi)
+    qhi = -min(-flo / dlo, -flo / dhi, -fhi / dlo, -fhi / dhi)
+    return max(lo, m - qhi), min(hi, -(qlo - m))
+
+
+def _divmod(p, q):
+    "Quotient and remainder of the division of polynomials with Fraction coefficients, lowest first."
+    p, quotient = list(p), [Fraction(0)] * max(len(p) - len(q) + 1, 0)
+    for i in range(len(p) - len(q), -1, -1):
+        quotient[i] = f = p[i + len(q) - 1] / q[-1]
+        for j, c in enumerate(q):
+            p[i + j] -= f * c
+    while p and not p[-1]:
+        p.pop()
+    return quotient, p
+
+
+def _squarefree(p):
+    "The squarefree part of a polynomial with Fraction coefficients, as integer coefficients."
+    a, b = p, [k * c for k, c in enumerate(p)][1:]
+    while b:
+        a, b = b, _divmod(a, b)[1]
+    q = _divmod(p, a)[0]
+    scale = 1
+    for c in q:
+        scale = scale * c.denominator // _gcd(scale, c.denominator)
+    return [int(c * scale) for c in q]
+
+
+def _gcd(a, b):
+    while b:
+        a, b = b, a % b
+    return a
+
+
+def _isolate(q, lo, hi):
+    """Isolate the roots of q in the open interval (lo, hi).
+
+    The argument q is a squarefree polynomial with integer coefficients.
+    Return a list of exact rational intervals (a, b), each containing
+    exactly one root, with a == b for the roots found exactly.
+    """
+    width = hi - lo
+    scale = _shift(q, lo)
+    scale = [c * width ** k for k, c in enumerate(scale)]
+    denominator = 1
+    for c in scale:
+        denominator = denominator * c.denominator // _gcd(denominator, c.denominator)
+    found = []
+    # Each entry is a polynomial whose roots in (0, 1) are those of q
+    # in (lo + width * c / 2 ** k, lo + width * (c + 1) / 2 ** k).
+    stack = [([int(c * denominator) for c in scale], 0, 0)]
+    while stack:
+        r, c, k = stack.pop()
+        x = lo + width * Fraction(c, 2 ** k)
+        if not r[0]:
+            found.append((x, x))
+            r = r[1:]
+        v = _variations(_shift(r[::-1], 1))
+        if v == 1:
+            found.append((x, lo + width * Fraction(c + 1, 2 ** k)))
+        elif v > 1:
+            n = len(r) - 1
+            left = [a << (n - i) for i, a in enumerate(r)]
+            stack.append((_shift(left, 1), 2 * c + 1, k + 1))
+            stack.append((left, 2 * c, k + 1))
+    return found
+
+
+class polynomial(object):
+    """A polynomial with numeric or interval coefficients.
+
+    The coefficients are listed from the constant term up. Interval
+    coefficients are replaced by their hull. Evaluating a polynomial
+    on an interval encloses its range:
+
+        >>> polynomial([0, -1, 1])(interval[0, 2])
+        interval([-2.0, 2.0])
+
+    """
+
+    __slots__ = ('coefficients', '_bounds', '_exact', '_squarefree')
+
+    def __init__(self, coefficients):
+        coefficients = list(coefficients)
+        while coefficients and _exact(coefficients[-1]) == 0:
+            coefficients.pop()
+        self.coefficients = tuple(coefficients)
+        bounds = []
+        for c in coefficients:
+            q = _exact(c)
+            if q is not None:
+                bounds.append(_enclose(q))
+            else:
+                c = interval.hull((interval.cast(c),))
+                bounds.append((c[0].inf, c[0].sup))
+        self._bounds = bounds[::-1]
+        exact = [_exact(c) for c in coefficients]
+        self._exact = None if None in exact else exact
+        self._squarefree = None
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, list(self.coefficients))
+
+    @property
+    def degree(self):
+        "The degree, or -1 for the zero polynomial."
+        return len(self.coefficients) - 1
+
+    def derivative(self):
+        """Return the derivative.
+
+            >>> polynomial([1, -2, 0, 1]).derivative()
+            polynomial([-2, 0, 3])
+
+        Coefficients that are not exact integers or fractions are
+        multiplied as intervals:
+
+            >>> polynomial([0, 0.1, 0, 0.1]).derivative()
+            polynomial([0.1, 0, interval([0.3, 0.30000000000000004])])
+
+        """
+        def times(k, c):
+            if isinstance(c, interval) or isinstance(c, float) and k * c != Fraction(c) * k:
+                return interval.cast(c) * k
+            return k * c
+        return type(self)([times(k, c) for k, c in enumerate(self.coefficients)][1:])
+
+    def __call__(self, x):
+        "Evaluate the polynomial on an interval by Horner's scheme."
+        x = interval.cast(x)
+        if not self._bounds:
+            return interval.new((interval.Component(0.0, 0.0),) if x else ())
+        values = fpu.down(lambda: [_horner(self._bounds, a, b) for a, b in x])
+        components = []
+        for c, (lo, hi) in zip(x, values):
+            if lo == lo and hi == hi:
+                components.append(interval.Component(lo, hi))
+            else:
+                components.extend(self._generic(interval.new((c,))))
+        return interval._canonical(components)
+
+    def _generic(self, x):
+        "Evaluate the polynomial on an interval with the interval operations."
+        y = interval[self._bounds[0]]
+        for c in self._bounds[1:]:
+            y = y * x + interval[c]
+        return y
+
+    def centered(self, x):
+        """Evaluate the polynomial on an interval with the Taylor form at the midpoint.
+
+        The polynomial is expanded exactly at the midpoint m of each
+        bounded component, and the powers of (x - m) are bounded
+        independently. The overestimation shrinks quadratically with
+        the width of the components. The result is intersected with
+        Horner's scheme.
+        """
+        x = interval.cast(x)
+        components = []
+        for c in x:
+            y = self(interval.new((c,)))
+            if -fpu.infinity < c.inf < c.sup < fpu.infinity and len(self._bounds) > 2:
+                m = c.inf / 2 + c.sup / 2
+                z = fpu.down(lambda: self._taylor(m, fpu.max((-(m - c.sup), -(c.inf - m)))))
+                if z[0] == z[0] and z[1] == z[1]:
+                    y &= interval[z]
+            components.extend(y)
+        return interval._canonical(components)
+
+    def _taylor(self, m, r):
+        "Enclose the polynomial over [m - r, m + r] by its Taylor expansion at m, when rounding downwards."
+        q = list(self._bounds[::-1])
+        n = len(q)
+        for i in range(n - 1):
+            for j in range(n - 2, i - 1, -1):
+                lo, hi = _mul(q[j + 1][0], q[j + 1][1], m, m)
+                q[j] = lo + q[j][0], -(-hi - q[j][1])
+        lo, hi = q[0]
+        power = 1.0
+        for k in range(1, n):
+            power = -(-power * r)
+            a, b = _mul(q[k][0], q[k][1], -power if k % 2 else 0.0, power)
+            lo, hi = lo + a, -(-hi - b)
+        return lo, hi
+
+    def isolate(self, x=None):
+        """Isolate the distinct real roots, in exact rational arithmetic.
+
+        Return a sorted list of pairs of Fractions (a, b), each
+        enclosing exactly one root, with a == b if the root is exactly
+        known. The roots are searched in x, if given:
+
+            >>> polynomial([-2, 0, 1]).isolate()
+            [(Fraction(-4, 1), Fraction(0, 1)), (Fraction(0, 1), Fraction(4, 1))]
+            >>> polynomial([-2, 0, 1]).isolate(interval[0, 1.5])
+            [(Fraction(0, 1), Fraction(3, 2))]
+
+        The method of Descartes is applied to the squarefree part of
+        the polynomial: the number of roots in an interval is bounded
+        by the number of sign changes in the coefficients of a
+        transformed polynomial, and the interval is bisected until
+        the bound is zero or one. A ValueError is raised if a
+        coefficient is not a single number, or if the polynomial is
+        zero.
+        """
+        if self._exact is None:
+            raise ValueError("Roots can be isolated only for polynomials with numeric coefficients")
+        if not self._exact:
+            raise ValueError("Every number is a root of the zero polynomial")
+        if self._squarefree is None:
+            self._squarefree = _squarefree(self._exact)
+        q = self._squarefree
+        # Cauchy's bound, strictly greater than the magnitude of the roots
+        bound = 2 + int(max(abs(c) for c in q[:-1]) / abs(q[-1])) if len(q) > 1 else 1
+        found = []
+        for c in (interval[-bound, bound] if x is None else interval.cast(x)):
+            lo = Fraction(c.inf) if c.inf > -bound else Fraction(-bound)
+            hi = Fraction(c.sup) if c.sup < bound else Fraction(bound)
+            if lo < hi:
+                found.extend(_isolate(q, lo, hi))
+            if lo <= hi and not _value(q, hi):
+                found.append((hi, hi))
+        return found
+
+    def roots(self, x=None, maxiter=10000):
+        """Enclose the distinct real roots, optionally only those in x.
+
+        The roots isolated by the method isolate are refined with the
+        interval Newton method, bisecting by the exact sign of the
+        polynomial where the derivative is not bounded away from zero.
+        Each component of the result contains a root, exactly one
+        unless the roots are too close to be separated by floats.
+        """
+        isolated = self.isolate(x)
+        q = self._squarefree
+        dq = [k * c for k, c in enumerate(q)][1:]
+        dbounds = self.derivative()._bounds or [(0.0, 0.0)]
+        return interval.union(self._refine(q, dq, dbounds, a, b, maxiter) for a, b in isolated)
+
+    def _refine(self, q, dq, dbounds, a, b, maxiter):
+        "Refine the enclosure of the only root in [a, b] of the squarefree part q of the polynomial."
+        lo, hi = _enclose(a)[0], _enclose(b)[1]
+        if a == b:
+            return interval[lo, hi]
+        # The signs just inside the ends, which may be other roots
+        slo = _sign(_value(q, a)) or _sign(_value(dq, a))
+        if slo == (_sign(_value(q, b)) or -_sign(_value(dq, b))):
+            return interval[lo, hi]
+        bounds = self._bounds
+        for i in range(maxiter):
+            m = lo / 2 + hi / 2
+            if not lo < m < hi:
+                break
+            y = fpu.down(lambda: _newton(bounds, dbounds, lo, m, hi))
+            if y is not None and y != (lo, hi):
+                if not y[0] <= y[1]:
+                    break
+                if y[0] != lo:
+                    slo = _sign_at(q, y[0])
+                    if not slo:
+                        return interval[y[0]]
+                lo, hi = y
+            else:
+                # The Newton step does not contract, so bisect instead
+                s = _sign_at(q, m)
+                if not s:
+                    return interval[m]
+                if s == slo:
+                    lo = m
+                else:
+                    hi = m
+        return interval[lo, hi]
@@ -0,0 +1,216 @@
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+"""\
+``interval.profiling`` --- Operation counters for interval computations
+-----------------------------------------------------------------------
+
+This module counts and times the interval operations performed within
+a block of code:
+
+    >>> from interval import interval
+    >>> x, y = interval([1, 2], [3, 4]), interval[-1, 1]
+    >>> with interval.profile() as stats:
+    ...     z = x * y + 1
+    >>> stats.calls['interval.__mul__'], stats.calls['interval.__add__'], stats.pairs
+    (1, 1, 3)
+    >>> stats.switches, sorted(stats.switches_by.items())
+    (6, [('interval.__add__', 2), ('interval.__mul__', 4)])
+    >>> sorted(stats.sorted.items())
+    [(1, 1), (2, 1)]
+
+A summary is printed by the method report.
+
+The counters are installed by replacing the attributes of the interval
+class and of the ``fpu`` and ``imath`` modules on entering the block,
+and removed on leaving it, so that they cost nothing when no profile
+is active. The statistics cover all the threads, and the times are
+inclusive of nested operations.
+"""
+
+import sys
+import threading
+from collections import defaultdict
+from functools import wraps
+from timeit import default_timer
+
+from . import interval, fpu
+
+_methods = (
+    '__pos__', '__neg__', '__add__', '__radd__', '__sub__', '__rsub__',
+    '__mul__', '__rmul__', '__div__', '__truediv__', '__rdiv__', '__rtruediv__',
+    '__pow__', '__and__', '__rand__', '__or__', '__ror__', '__contains__',
+    '__abs__', 'inverse', 'difference', 'symmetric_difference', 'complement',
+    'newton')
+
+_classmethods = ('union', 'hull')
+_cast = interval.cast
+
+_active = threading.Lock()
+
+
+class Stats(object):
+    """The statistics collected by a profile.
+
+    calls and time map the names of the operations to the number of
+    calls and to the total time spent in them, in seconds. The names
+    are those of the methods of the interval class, e.g.,
+    'interval.__add__', and of the functions of the fpu and imath
+    modules, e.g., 'fpu.up' and 'imath.exp'. components is the
+    histogram of the number of components of the intervals returned
+    by the operations, sorted is the histogram of the number of
+    components of the arguments of interval._canonical, and pairs is
+    the number of pairs of components combined by the component-wise
+    operations. switches_by maps the name of each operation to the
+    number of switches of the rounding mode that it performs itself,
+    rather than through nested operations; the switches outside any
+    operation are recorded under '(block)'.
+    """
+
+    def __init__(self):
+        self.calls = defaultdict(int)
+        self.time = defaultdict(float)
+        self.components = defaultdict(int)
+        self.sorted = defaultdict(int)
+        self.switches_by = defaultdict(int)
+        self.pairs = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def switches(self):
+        "The total number of switches of the rounding mode."
+        return self.calls['fpu.up'] + self.calls['fpu.down']
+
+    def _stack(self):
+        "The names of the operations in progress in the current thread."
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    def _record(self, name, elapsed, result, pairs=0):
+        with self._lock:
+            self.calls[name] += 1
+            self.time[name] += elapsed
+            self.pairs += pairs
+            if isinstance(result, interval):
+                self.components[len(result)] += 1
+
+    def report(self, file=None):
+        "Write a table of the calls, sorted by time, to file, or to the standard output."
+        file = file or sys.stdout
+        file.write('%-36s %10s %12s\n' % ('operation', 'calls', 'time [s]'))
+        for name in sorted(self.calls, key=lambda name: -self.time[name]):
+            file.write('%-36s %10d %12.6f\n' % (name, self.calls[name], self.time[name]))
+        file.write('%-36s %10d\n' % ('pairs of components', self.pairs))
+        file.write('rounding mode switches:\n')
+        for name in sorted(self.switches_by, key=lambda name: -self.switches_by[name]):
+            file.write('%-36s %10d\n' % (name, self.switches_by[name]))
+        for title, histogram in ('components of results', self.components), ('components sorted', self.sorted):
+            file.write('%s:\n' % title)
+            for n in sorted(histogram):
+                file.write('%36d %10d\n' % (n, histogram[n]))
+
+
+def _counting(stats, name, f, pairwise=False):
+    "Wrap f so that its calls are recorded in stats under name."
+    @wraps(f)
+    def wrapper(*args):
+        pairs = 0
+        if pairwise:
+            try:
+                pairs = len(args[0]) * len(_cast(args[1]))
+            except interval.ScalarError:
+                pass
+        stack = stats._stack()
+        stack.append(name)
+        start, result = default_timer(), None
+        try:
+            result = f(*args)
+            return result
+        finally:
+            stack.pop()
+            stats._record(name, default_timer() - start, result, pairs)
+    return wrapper
+
+
+def _switching(stats, name, f):
+    "Wrap a function of fpu so that its calls are recorded in stats, and attributed to the calling operation."
+    @wraps(f)
+    def wrapper(*args):
+        stack = stats._stack()
+        with stats._lock:
+            stats.switches_by[stack[-1] if stack else '(block)'] += 1
+        start = default_timer()
+        try:
+            return f(*args)
+        finally:
+            stats._record(name, default_timer() - start, None)
+    return wrapper
+
+
+def _sorting(stats, f):
+    "Wrap interval._canonical so that the number of components it sorts is recorded in stats."
+    @wraps(f)
+    def wrapper(cls, components):
+        components = list(components)
+        with stats._lock:
+            stats.sorted[len(components)] += 1
+        start = default_timer()
+        try:
+            return f(cls, components)
+        finally:
+            stats._record('interval._canonical', default_timer() - start, None)
+    return wrapper
+
+
+class profile(object):
+    """Context manager collecting the Stats of the interval operations in a block.
+
+    Only one profile can be active at a time: entering a second one
+    raises a RuntimeError.
+    """
+
+    def __init__(self):
+        self.stats = Stats()
+        self._saved = []
+
+    def _patch(self, owner, name, value):
+        self._saved.append((owner, name, owner.__dict__[name]))
+        setattr(owner, name, value)
+
+    def __enter__(self):
+        if not _active.acquire(False):
+            raise RuntimeError("Another profile is already active")
+        try:
+            import crlibm  # noqa
+        except ImportError:
+            imath = None
+        else:
+            # Import imath first, so that its initialization is not counted
+            from . import imath
+        stats = self.stats
+        for name in _methods:
+            if name in interval.__dict__:
+                f = interval.__dict__[name]
+                self._patch(interval, name, _counting(stats, 'interval.' + name, f, getattr(f, 'pairwise', False)))
+        for name in _classmethods:
+            f = interval.__dict__[name].__func__
+            self._patch(interval, name, classmethod(_counting(stats, 'interval.' + name, f)))
+        self._patch(interval, '_canonical', classmethod(_sorting(stats, interval.__dict__['_canonical'].__func__)))
+        for name in 'up', 'down':
+            self._patch(fpu, name, _switching(stats, 'fpu.' + name, getattr(fpu, name)))
+        if imath is not None:
+            for name, f in sorted(vars(imath).items()):
+                if not name.startswith('_') and callable(f) and getattr(f, '__module__', None) == imath.__name__:
+                    self._patch(imath, name, _counting(stats, 'imath.' + name, f))
+        return stats
+
+    def __exit__(self, *exc_info):
+        while self._saved:
+            owner, name, value = self._saved.pop()
+            setattr(owner, name, value)
+        _active.release()
@@ -0,0 +1,117 @@
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+"""\
+``interval.quadrature`` --- Validated numerical integration
+-----------------------------------------------------------
+
+This module computes rigorous enclosures of definite integrals:
+
+    >>> from interval import interval, imath
+    >>> integrate(lambda x: x ** 2, interval[0, 1], 1e-2).format('%.4f')
+    'interval([0.3284, 0.3383])'
+
+Far fewer subdivisions are needed if enclosures of the derivatives
+are available:
+
+    >>> integrate(lambda x: x ** 2, interval[0, 1], 1e-9, p=lambda x: 2 * x, p2=lambda x: interval[2])
+    interval([0.3333333333333333, 0.33333333333333337])
+    >>> integrate(imath.exp, interval[0, 1], 1e-9, p=imath.exp, p2=imath.exp)
+    interval([1.718281827963425, 1.7182818289553308])
+
+"""
+
+from . import interval, fpu
+
+
+def _hull(x):
+    "The hull of x, or the empty interval."
+    return interval.hull([x]) if x else x
+
+
+def _estimate(args):
+    """Enclose the integral of f over [u, v].
+
+    The argument is a tuple (f, p, p2, u, v), where p and p2 are
+    enclosures of the first and second derivatives of f, or None.
+    """
+    f, p, p2, u, v = args
+    x = interval[u, v]
+    m = x.midpoint
+    a, b = interval[v] - m, m - interval[u]
+    y = _hull(f(x)) * (a + b)
+    if p is not None and p2 is not None:
+        # The integral of f(m) + f'(m) * (t - m) + f''(s) * (t - m)**2 / 2
+        y &= f(m) * (a + b) + p(m) * (a ** 2 - b ** 2) / 2 + _hull(p2(x)) * (a ** 3 + b ** 3) / 6
+    elif p is not None:
+        # The integral of f(m) + f'(s) * (t - m), separately on each side of m
+        d = _hull(p(x))
+        y &= f(m) * (a + b) + d * a ** 2 / 2 - d * b ** 2 / 2
+    return _hull(y)
+
+
+def integrate(f, x, tol, p=None, p2=None, maxeval=10000, pool=None, chunksize=64):
+    """Enclose the integral of f over the interval x.
+
+    The interval x is bisected adaptively, always splitting the parts
+    with the widest enclosures, until the width of the result is at
+    most tol or f has been evaluated over maxeval parts. Parts too
+    narrow to be bisected are left as they are. The enclosure over
+    each part is the interval Riemann sum, intersected with a
+    Taylor bound if the enclosure p of the derivative of f is
+    provided. The bound is of second order if the enclosure p2 of the
+    second derivative is provided as well.
+
+    The parts can be evaluated on a pool of workers, e.g., a
+    multiprocessing.Pool, in which case up to chunksize parts are
+    split at each step, and f, p and p2 must be picklable:
+
+        >>> from multiprocessing import Pool
+        >>> with Pool(2) as pool:  # doctest: +SKIP
+        ...     integrate(imath.exp, interval[0, 1], 1e-12, p=imath.exp, pool=pool)
+
+    """
+    from heapq import heapify, heappop, heappush
+    if pool is None:
+        mapper, chunksize = map, 1
+    else:
+        mapper = pool.map
+    parts = [(c.inf, c.sup) for c in interval.cast(x)]
+    heap = [(-_width(y), u, v, y) for (u, v), y in zip(parts, mapper(_estimate, [(f, p, p2, u, v) for u, v in parts]))]
+    heapify(heap)
+    # The parts of infinite width are counted apart, as adding and
+    # subtracting infinite widths would give a nan.
+    unbounded = sum(1 for w, u, v, y in heap if w == -fpu.infinity)
+    width = sum(-w for w, u, v, y in heap if w != -fpu.infinity)
+    count, done = len(heap), []
+    while heap and (unbounded or width > tol) and count < maxeval:
+        split = []
+        while heap and len(split) < 2 * chunksize:
+            w, u, v, y = heappop(heap)
+            m = u / 2 + v / 2
+            if not y or not u < m < v:
+                # The part cannot be refined any further
+                done.append(y)
+                continue
+            split.extend(((u, m), (m, v)))
+            if w == -fpu.infinity:
+                unbounded -= 1
+            else:
+                width += w
+        if not split:
+            break
+        for (u, v), y in zip(split, mapper(_estimate, [(f, p, p2, u, v) for u, v in split])):
+            w = _width(y)
+            heappush(heap, (-w, u, v, y))
+            if w == fpu.infinity:
+                unbounded += 1
+            else:
+                width += w
+        count += len(split)
+    return sum([y for w, u, v, y in heap] + done, interval[0])
+
+
+def _width(x):
+    "The width of the hull of x, or zero if x is empty."
+    return fpu.up(lambda: x[-1].sup - x[0].inf) if x else 0.0
@@ -0,0 +1,154 @@
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+"""\
+``interval.sets`` --- Building intervals incrementally
+------------------------------------------------------
+
+Since intervals are immutable, building a large interval one
+component at a time with the | operator sorts all the components at
+every step. This module provides a mutable builder instead:
+
+    >>> from interval import interval
+    >>> s = IntervalSet()
+    >>> for i in range(5):
+    ...     s.add(interval[2 * i, 2 * i + 1])
+    >>> s.add(interval[3, 4])
+    >>> s.remove(interval[8.5, 10])
+    >>> s.freeze()
+    interval([0.0, 1.0], [2.0, 5.0], [6.0, 7.0], [8.0, 8.5])
+
+"""
+
+from bisect import bisect_left, bisect_right
+from . import interval
+
+
+class IntervalSet(object):
+    """A mutable union of disjoint closed components.
+
+    The lower and upper bounds of the components are kept sorted in a
+    list of blocks of bounded size, indexed by the largest upper bound
+    of each block. Adding or removing an interval locates the
+    components it touches by bisection, and replaces them in place by
+    the merged or trimmed ones, so that only one block is rewritten in
+    the usual case.
+
+    Like interval, an IntervalSet represents a closed set: removing an
+    interval leaves the closure of the difference, so that the
+    endpoints of the removed interval are kept if they are limits of
+    the remaining points:
+
+        >>> s = IntervalSet([interval[0, 4]])
+        >>> s.remove(interval[1, 2])
+        >>> s.remove(3)
+        >>> s.freeze()
+        interval([0.0, 1.0], [2.0, 4.0])
+
+    """
+
+    # Blocks are split when they grow beyond twice this size
+    _load = 500
+
+    def __init__(self, intervals=()):
+        x = interval.union(interval.cast(x) for x in intervals)
+        infs, sups = [c.inf for c in x], [c.sup for c in x]
+        n = self._load
+        self._blocks = [(infs[k:k + n], sups[k:k + n]) for k in range(0, len(infs), n)]
+        self._maxes = [b[-1] for _, b in self._blocks]
+
+    def __len__(self):
+        "The number of components."
+        return sum(len(infs) for infs, _ in self._blocks)
+
+    def __iter__(self):
+        "Iterate on the components as intervals."
+        for infs, sups in self._blocks:
+            for a, b in zip(infs, sups):
+                yield interval.new((interval.Component(a, b),))
+
+    def __contains__(self, p):
+        k = bisect_left(self._maxes, p)
+        if k == len(self._blocks):
+            return False
+        infs, sups = self._blocks[k]
+        i = bisect_right(infs, p)
+        return i > 0 and p <= sups[i - 1]
+
+    def _splice(self, a, b, replace):
+        """Replace the components that overlap or touch [a, b].
+
+        The function replace receives the lower bound of the first and
+        the upper bound of the last of these components, or twice None
+        if there are none, and returns the list of (inf, sup) pairs
+        that take their place.
+        """
+        blocks, maxes = self._blocks, self._maxes
+        if not blocks:
+            blocks.append(([], []))
+            maxes.append(b)
+        k = min(bisect_left(maxes, a), len(blocks) - 1)
+        infs, sups = blocks[k]
+        i, j = bisect_left(sups, a), bisect_right(infs, b)
+        # The touched components may extend over the following blocks
+        m, n = k, j
+        while n == len(blocks[m][0]) and m + 1 < len(blocks) and blocks[m + 1][0][0] <= b:
+            m += 1
+            n = bisect_right(blocks[m][0], b)
+        pairs = replace(infs[i], blocks[m][1][n - 1]) if i < j else replace(None, None)
+        if m == k:
+            infs[i:j] = [p[0] for p in pairs]
+            sups[i:j] = [p[1] for p in pairs]
+        else:
+            last_infs, last_sups = blocks[m]
+            infs[i:] = [p[0] for p in pairs] + last_infs[n:]
+            sups[i:] = [p[1] for p in pairs] + last_sups[n:]
+            del blocks[k + 1:m + 1], maxes[k + 1:m + 1]
+        if not infs:
+            del blocks[k], maxes[k]
+        elif len(infs) > 2 * self._load:
+            h = len(infs) // 2
+            blocks[k:k + 1] = [(infs[:h], sups[:h]), (infs[h:], sups[h:])]
+            maxes[k:k + 1] = [sups[h - 1], sups[-1]]
+        else:
+            maxes[k] = sups[-1]
+
+    def add(self, x):
+        "Add an interval, merging the components that it overlaps or touches."
+        for c in interval.cast(x):
+            a, b = c.inf, c.sup
+
+            def merged(lo, hi):
+                if lo is None:
+                    return [(a, b)]
+                return [(min(a, lo), max(b, hi))]
+            self._splice(a, b, merged)
+
+    def update(self, intervals):
+        "Add all the intervals of an iterable."
+        for x in intervals:
+            self.add(x)
+
+    def remove(self, x):
+        "Remove an interval, keeping the closure of the remaining points."
+        for c in interval.cast(x):
+            a, b = c.inf, c.sup
+
+            def trimmed(lo, hi):
+                if lo is None:
+                    return []
+                if lo < a and hi > b and a == b:
+                    # The closure of a component with an inner point removed
+                    return [(lo, hi)]
+                return ([(lo, a)] if lo < a else []) + ([(b, hi)] if hi > b else [])
+            self._splice(a, b, trimmed)
+
+    def clear(self):
+        "Remove all the components."
+        del self._blocks[:], self._maxes[:]
+
+    def freeze(self):
+        "Return the union of the components as an interval."
+        component = interval.Component
+        return interval.new([tuple.__new__(component, c) for infs, sups in self._blocks for c in zip(infs, sups)])
@@ -0,0 +1,182 @@
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+"""\
+``interval.shared`` --- Intervals in shared memory
+--------------------------------------------------
+
+This module stores collections of intervals in a block of shared
+memory, so that they can be processed by a pool of worker processes
+without pickling the intervals: only the name of the block is sent to
+the workers, which read their inputs and write their outputs in
+place. It requires Python 3.8 or later.
+
+    >>> from interval import interval, imath
+    >>> x = SharedIntervalArray.from_intervals([interval[0, 1], interval[1, 2]])
+    >>> y = evaluate(imath.exp, x)
+    >>> y[1].format('%.4f')
+    'interval([2.7183, 7.3891])'
+    >>> for a in x, y:
+    ...     a.unlink()
+
+"""
+
+import struct
+from array import array
+from multiprocessing import shared_memory
+from . import interval
+
+_header = struct.Struct('<QQ')
+_attached = {}
+
+
+class SharedIntervalArray(object):
+    """A fixed-size sequence of intervals in a block of shared memory.
+
+    Each of the size slots of the array holds an interval with up to
+    capacity components. Slots are initially empty and are assigned
+    by item:
+
+        >>> a = SharedIntervalArray(3, capacity=2)
+        >>> a[0] = interval(1, [2, 3])
+        >>> a[2] = 4
+        >>> list(a)
+        [interval([1.0], [2.0, 3.0]), interval(), interval([4.0])]
+
+    An instance pickled by a process is unpickled by another process
+    as a view on the same block of shared memory, which is opened only
+    once per process.
+
+    The process that creates the array is responsible for calling its
+    unlink method to free the shared memory when no process needs it
+    any longer:
+
+        >>> a.unlink()
+
+    """
+
+    def __init__(self, size, capacity=1, name=None):
+        if name is None:
+            nbytes = _header.size + 8 * size + 16 * size * capacity
+            self._shm = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+            _header.pack_into(self._shm.buf, 0, size, capacity)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+            size, capacity = _header.unpack_from(self._shm.buf)
+        self.size, self.capacity = size, capacity
+        start = _header.size
+        middle = start + 8 * size
+        self._counts = self._shm.buf[start:middle].cast('Q')
+        self._endpoints = self._shm.buf[middle:middle + 16 * size * capacity].cast('d')
+        # The first view opened by this process is the one returned upon unpickling
+        _attached.setdefault(self.name, self)
+
+    @classmethod
+    def from_intervals(cls, intervals, capacity=None):
+        """Create an array holding a sequence of intervals.
+
+        The capacity defaults to the largest number of components.
+        """
+        intervals = [interval.cast(x) for x in intervals]
+        if capacity is None:
+            capacity = max([len(x) for x in intervals] + [1])
+        self = cls(len(intervals), capacity)
+        for i, x in enumerate(intervals):
+            self[i] = x
+        return self
+
+    @property
+    def name(self):
+        "The name of the block of shared memory."
+        return self._shm.name
+
+    def __len__(self):
+        return self.size
+
+    def _index(self, i):
+        if i < 0:
+            i += self.size
+        if not 0 <= i < self.size:
+            raise IndexError("SharedIntervalArray index out of range")
+        return i
+
+    def __getitem__(self, i):
+        i = self._index(i)
+        start = 2 * i * self.capacity
+        e = self._endpoints[start:start + 2 * self._counts[i]]
+        component = interval.Component
+        return interval.new([tuple.__new__(component, (e[j], e[j + 1])) for j in range(0, len(e), 2)])
+
+    def __setitem__(self, i, x):
+        i = self._index(i)
+        x = interval.cast(x)
+        if len(x) > self.capacity:
+            raise ValueError("Too many components for a slot of capacity %d: %r" % (self.capacity, x))
+        start = 2 * i * self.capacity
+        self._endpoints[start:start + 2 * len(x)] = array('d', [e for c in x for e in c])
+        self._counts[i] = len(x)
+
+    def __iter__(self):
+        for i in range(self.size):
+            yield self[i]
+
+    def __reduce__(self):
+        return _attach, (self.name,)
+
+    def close(self):
+        "Detach this process from the shared memory."
+        if _attached.get(self.name) is self:
+            del _attached[self.name]
+        self._counts.release()
+        self._endpoints.release()
+        self._shm.close()
+
+    def unlink(self):
+        "Detach this process from the shared memory and free it."
+        self.close()
+        self._shm.unlink()
+
+
+def _attach(name):
+    "Return the view of this process on a SharedIntervalArray."
+    try:
+        return _attached[name]
+    except KeyError:
+        return SharedIntervalArray(0, name=name)
+
+
+def _evaluate(args):
+    f, x, out, start, stop = args
+    for i in range(start, stop):
+        out[i] = f(x[i])
+
+
+def evaluate(f, x, out=None, pool=None, chunksize=1024):
+    """Store the image under f of each interval of x into out, and return out.
+
+    The array out must be a SharedIntervalArray of the same size as x.
+    If it is not specified, it is created with the same capacity as x.
+    A ValueError is raised if an image has more components than the
+    capacity of out.
+
+    The intervals can be processed on a pool of workers, e.g., a
+    multiprocessing.Pool, in chunks of chunksize consecutive slots, in
+    which case f must be picklable:
+
+        >>> from multiprocessing import Pool
+        >>> with Pool(4) as pool:  # doctest: +SKIP
+        ...     evaluate(imath.exp, x, pool=pool)
+
+    """
+    if out is None:
+        out = SharedIntervalArray(len(x), x.capacity)
+    elif len(out) != len(x):
+        raise ValueError("Mismatched sizes: %d and %d" % (len(x), len(out)))
+    tasks = [(f, x, out, i, min(i + chunksize, len(x))) for i in range(0, len(x), chunksize)]
+    if pool is None:
+        for t in tasks:
+            _evaluate(t)
+    else:
+        pool.map(_evaluate, tasks)
+    return out
@@ -0,0 +1,240 @@
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+"""\
+``interval.storage`` --- Compact storage of collections of intervals
+--------------------------------------------------------------------
+
+This module stores collections of intervals as two flat arrays: the
+endpoints of all the components, and the offsets at which the
+components of each interval start. Files in this format are written
+incrementally and read back through a memory map, so that collections
+much larger than the available memory can be processed lazily:
+
+    >>> import os, tempfile
+    >>> from interval import interval
+    >>> path = os.path.join(tempfile.mkdtemp(), 'example.ivl')
+    >>> save(path, [interval[1, 2], interval(3, [4, 5]), interval()])
+    >>> with load(path) as a:
+    ...     len(a), a[1], list(a.offsets)
+    (3, interval([3.0], [4.0, 5.0]), [0, 1, 3, 3])
+
+The file starts with a header consisting of a magic string, a version
+number, the number of intervals and the total number of components.
+It is followed by the endpoints, as 64-bit floats, and by the offsets,
+as unsigned 64-bit integers, all little-endian.
+"""
+
+import struct
+import sys
+import weakref
+from array import array
+from . import interval
+
+_magic = b'IVLA'
+_version = 1
+_header = struct.Struct('<4sIQQ')
+
+
+class IntervalArray(object):
+    """A sequence of intervals stored in flat arrays.
+
+    The components of the i-th interval are the pairs of consecutive
+    endpoints between the indices 2 * offsets[i] and 2 * offsets[i +
+    1]. The arrays can be any sequences supporting slicing, e.g.,
+    instances of array.array, memoryviews or numpy arrays:
+
+        >>> a = IntervalArray.from_intervals([interval[1, 2], interval(3, [4, 5])])
+        >>> list(a)
+        [interval([1.0, 2.0]), interval([3.0], [4.0, 5.0])]
+        >>> list(a.endpoints)
+        [1.0, 2.0, 3.0, 3.0, 4.0, 5.0]
+
+    Slicing an IntervalArray returns a view on the same endpoints.
+    """
+
+    def __init__(self, offsets, endpoints):
+        self.offsets = offsets
+        self.endpoints = endpoints
+        self._mmap = None
+        # The live slices of an array on a memory map, keyed by id
+        self._slices = None
+
+    @classmethod
+    def from_intervals(cls, intervals):
+        "Create an IntervalArray in memory from an iterable of intervals."
+        try:
+            offsets = array('Q', [0])
+        except ValueError:  # pragma: PY2 only
+            offsets = [0]
+        endpoints = array('d')
+        for x in intervals:
+            x = interval.cast(x)
+            endpoints.extend(e for c in x for e in c)
+            offsets.append(offsets[-1] + len(x))
+        return cls(offsets, endpoints)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, step = i.indices(len(self))
+            if step != 1:
+                raise ValueError("IntervalArray slices must be contiguous")
+            result = type(self)(self.offsets[start:max(start, stop) + 1], self.endpoints)
+            result._slices = self._slices
+            if self._slices is not None:
+                self._slices[id(result)] = result
+            return result
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("IntervalArray index out of range")
+        e = self.endpoints[2 * self.offsets[i]:2 * self.offsets[i + 1]]
+        component = interval.Component
+        return interval.new([tuple.__new__(component, (e[j], e[j + 1])) for j in range(0, len(e), 2)])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def numpy(self):
+        """Return views on the offsets and on the endpoints as numpy arrays.
+
+        The endpoints are returned as an array with two columns, for
+        the lower and upper bounds respectively. Arrays that do not
+        support the buffer protocol, e.g., lists, are copied instead.
+        The views on a memory map must be deleted before the
+        IntervalArray is closed. This method requires numpy.
+        """
+        import numpy
+        try:
+            offsets = numpy.frombuffer(self.offsets, dtype=numpy.uint64)
+            endpoints = numpy.frombuffer(self.endpoints, dtype=numpy.float64)
+        except (TypeError, AttributeError):  # pragma: nocover
+            offsets = numpy.array(self.offsets, dtype=numpy.uint64)
+            endpoints = numpy.array(self.endpoints, dtype=numpy.float64)
+        return offsets, endpoints.reshape(-1, 2)
+
+    def close(self):
+        """Release the memory map, if any.
+
+        The slices of the array become invalid. A BufferError is raised
+        if views returned by the method numpy are still alive.
+        """
+        if self._mmap is not None:
+            for x in list(self._slices.values()) + [self]:
+                for a in x.offsets, x.endpoints:
+                    release = getattr(a, 'release', None)
+                    if release is not None:
+                        release()
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            self.close()
+        except BufferError:
+            # Do not mask the exception raised in the block, if any
+            if exc_type is None:
+                raise
+
+
+class IntervalWriter(object):
+    """Write intervals incrementally to a file.
+
+    The offsets are buffered in a temporary file and appended to the
+    endpoints when the writer is closed, so that the memory usage does
+    not depend on the number of intervals written:
+
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), 'example.ivl')
+        >>> with IntervalWriter(path) as w:
+        ...     for i in range(1000):
+        ...         w.write(interval[i, i + 1])
+        >>> with load(path) as a:
+        ...     len(a), a[999]
+        (1000, interval([999.0, 1000.0]))
+
+    """
+
+    def __init__(self, path):
+        import tempfile
+        self._file = open(path, 'wb')
+        self._offsets = tempfile.TemporaryFile()
+        self._file.write(_header.pack(_magic, _version, 0, 0))
+        self._offsets.write(struct.pack('<Q', 0))
+        self._count = self._size = 0
+
+    def write(self, x):
+        "Append an interval."
+        x = interval.cast(x)
+        self._file.write(x.to_bytes()[8:])
+        self._count += 1
+        self._size += len(x)
+        self._offsets.write(struct.pack('<Q', self._size))
+
+    def extend(self, intervals):
+        "Append all the intervals of an iterable."
+        for x in intervals:
+            self.write(x)
+
+    def close(self):
+        "Complete the file."
+        import shutil
+        if self._file.closed:
+            return
+        self._offsets.seek(0)
+        shutil.copyfileobj(self._offsets, self._file)
+        self._offsets.close()
+        self._file.seek(0)
+        self._file.write(_header.pack(_magic, _version, self._count, self._size))
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def save(path, intervals):
+    "Write an iterable of intervals to a file."
+    with IntervalWriter(path) as w:
+        w.extend(intervals)
+
+
+def load(path):
+    """Open a file written by save or IntervalWriter as an IntervalArray.
+
+    The file is memory-mapped and its content is accessed only on
+    demand. The IntervalArray should be closed when no longer needed.
+    """
+    import mmap
+    with open(path, 'rb') as f:
+        m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, count, size = _header.unpack_from(m)
+    if magic != _magic or version != _version:
+        m.close()
+        raise ValueError("Invalid interval file: " + repr(path))
+    start = _header.size
+    middle = start + 16 * size
+    end = middle + 8 * (count + 1)
+    try:
+        if sys.byteorder != 'little':  # pragma: nocover
+            raise TypeError
+        view = memoryview(m)
+        result = IntervalArray(view[middle:end].cast('Q'), view[start:middle].cast('d'))
+    except (TypeError, AttributeError, NameError):  # pragma: nocover
+        # Without zero-copy casts, e.g., on Python 2, read the arrays.
+        result = IntervalArray(
+            list(struct.unpack_from('<%dQ' % (count + 1), m, middle)),
+            list(struct.unpack_from('<%dd' % (2 * size), m, start)))
+    result._mmap = m
+    result._slices = weakref.WeakValueDictionary()
+    return result
@@ -0,0 +1,112 @@
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+"""\
+``interval.streaming`` --- Reductions over streams of intervals
+---------------------------------------------------------------
+
+The class methods interval.union and interval.hull collect all the
+components of their arguments into a list before processing them.
+The functions of this module consume their arguments in chunks
+instead, so that the memory they use depends on the size of the
+chunks and of the result, but not on the length of the stream:
+
+    >>> from interval import interval
+    >>> union((interval[i, i + 0.5] for i in range(10 ** 4)), chunksize=1000)[-1]
+    (9999.0, 9999.5)
+    >>> hull(interval[i, i + 0.5] for i in range(10 ** 4))
+    interval([0.0, 9999.5])
+
+"""
+
+from array import array
+from itertools import islice
+from . import interval
+
+
+def _chunks(intervals, chunksize):
+    "Iterate on lists of up to chunksize intervals."
+    intervals = iter(intervals)
+    while True:
+        chunk = list(islice(intervals, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _flatten(chunk):
+    "The endpoints of the components of a chunk of intervals, in an array."
+    return array('d', [x for i in chunk for c in i for x in c])
+
+
+def _components(endpoints):
+    "The components whose endpoints are stored in an array."
+    component = interval.Component
+    it = iter(endpoints)
+    return [tuple.__new__(component, c) for c in zip(it, it)]
+
+
+def _canonical(endpoints):
+    "Canonicalize the components stored in an array, returning them in another."
+    return _flatten([interval._canonical(_components(endpoints))])
+
+
+def _merge(partials, x):
+    "Push a canonical interval on a stack of partial unions, merging those of similar size."
+    partials.append(x)
+    while len(partials) > 1 and len(partials[-2]) <= 2 * len(partials[-1]):
+        x = partials.pop()
+        partials[-1] = interval._canonical(list(partials[-1]) + list(x))
+
+
+def union(intervals, chunksize=65536, pool=None, waves=4):
+    """Return the union of the intervals of an iterable, as interval.union does.
+
+    The intervals are consumed in chunks of chunksize. The unions of
+    the chunks are merged pairwise as in a binary counter, so that the
+    components of each interval are merged a logarithmic number of
+    times, and each merge is a linear pass over sorted components.
+
+    The unions of the chunks can be computed on a pool of workers,
+    e.g., a multiprocessing.Pool. In this case the chunks are sent to
+    the pool as arrays of endpoints, waves chunks at a time:
+
+        >>> from multiprocessing import Pool
+        >>> with Pool(4) as pool:  # doctest: +SKIP
+        ...     union(intervals, pool=pool)
+
+    """
+    partials = []
+    chunks = _chunks(intervals, chunksize)
+    if pool is None:
+        for chunk in chunks:
+            _merge(partials, interval.union(chunk))
+    else:
+        while True:
+            wave = [_flatten(chunk) for chunk in islice(chunks, waves)]
+            if not wave:
+                break
+            for endpoints in pool.map(_canonical, wave):
+                _merge(partials, interval.new(_components(endpoints)))
+    return interval.union(partials)
+
+
+def hull(intervals):
+    """Return the hull of the intervals of an iterable, as interval.hull does.
+
+    The intervals are consumed one at a time. A ValueError is raised
+    if all of them are empty.
+    """
+    lo = hi = None
+    for x in intervals:
+        x = interval.cast(x)
+        if not x:
+            continue
+        if lo is None:
+            lo, hi = x[0].inf, x[-1].sup
+        else:
+            lo, hi = min(lo, x[0].inf), max(hi, x[-1].sup)
+    if lo is None:
+        raise ValueError("The hull of empty intervals")
+    return interval.new((interval.Component(lo, hi),))
@@ -0,0 +1,177 @@
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+"""\
+``interval.text`` --- Reading and writing intervals as text
+------------------------------------------------------------
+
+This module formats intervals in bulk, and parses intervals written in
+the notation produced by interval.format and repr, as well as single
+components and numbers:
+
+    >>> parse('interval([1.0, 2.0], [3.0])')
+    interval([1.0, 2.0], [3.0])
+    >>> parse('[-1.5, 2.5]')
+    interval([-1.5, 2.5])
+
+Decimal numbers that are not exactly representable as floats are
+rounded outward, so that the result encloses the number as written:
+
+    >>> parse('[0.1, 0.3]')
+    interval([0.09999999999999999, 0.30000000000000004])
+
+Each number in the output of repr is the shortest string that is
+converted back to the same float, so that parsing it with exact=True
+reproduces the original interval:
+
+    >>> x = interval[0.1, 0.3]
+    >>> parse(repr(x), exact=True) == x
+    True
+
+"""
+
+import re
+import sys
+from decimal import Decimal
+from six import text_type
+from . import interval, fpu
+
+_number = r'[-+]?(?:inf|(?:\d+\.?\d*|\.\d+)(?:e[-+]?\d+)?)'
+_component = re.compile(r'\s*\[\s*(%s)\s*(?:,\s*(%s)\s*)?\]\s*(,|$)' % (_number, _number), re.IGNORECASE)
+_wrapper = re.compile(r'\s*[A-Za-z_]\w*\s*\((.*)\)\s*$')
+_scalar = re.compile(r'\s*(%s)\s*$' % _number, re.IGNORECASE)
+_integer = re.compile(r'[-+]?\d{1,15}$')
+
+
+def _nearest(s):
+    "The float nearest to the number s, as both bounds."
+    x = fpu.float(s)
+    return x, x
+
+
+def _outward(s):
+    "The floats immediately below and above the number s, which coincide if s is a float."
+    x = fpu.float(s)
+    if _integer.match(s):
+        return x, x
+    d, e = Decimal(s), Decimal(x)
+    if d == e:
+        return x, x
+    if e < d:
+        return x, -_below(-x)
+    return _below(x), x
+
+
+def _below(x):
+    "The largest float less than x."
+    return fpu.down(lambda: x - 5e-324) if x < fpu.infinity else sys.float_info.max
+
+
+def parse(s, exact=False):
+    """Parse an interval from a string.
+
+    The string can be in the notation of repr, str and interval.format
+    with any %e, %E, %f, %g, %G or %r format, or it can be a single
+    component in square brackets, or a number. The endpoints of a component may
+    be in any order. A ValueError is raised if the string is invalid.
+
+    If exact is false, the decimal numbers are rounded outward.
+    Otherwise they are rounded to the nearest float, which is the
+    correct interpretation of the output of repr.
+    """
+    bounds = _nearest if exact else _outward
+    m = _wrapper.match(s)
+    if m is not None:
+        s = m.group(1)
+        if not s.strip():
+            return interval()
+    else:
+        m = _scalar.match(s)
+        if m is not None:
+            return interval.new((interval.Component(*bounds(m.group(1))),))
+    components = []
+    pos, end = 0, len(s)
+    while pos < end:
+        m = _component.match(s, pos)
+        if m is None or m.end() == end and m.group(3):
+            raise ValueError("Invalid interval: " + repr(s))
+        a = bounds(m.group(1))
+        b = a if m.group(2) is None else bounds(m.group(2))
+        components.append(interval.Component(min(a[0], b[0]), max(a[1], b[1])))
+        pos = m.end()
+    if not components:
+        raise ValueError("Invalid interval: " + repr(s))
+    return interval._canonical(components)
+
+
+def iterparse(lines, exact=False):
+    """Iterate on the intervals parsed from each non-blank line.
+
+    The argument can be any iterable of strings, e.g., a file object:
+
+        >>> list(iterparse(['[1, 2]', '', 'interval([3.0])']))
+        [interval([1.0, 2.0]), interval([3.0])]
+
+    """
+    for line in lines:
+        if line.strip():
+            yield parse(line, exact)
+
+
+def parse_array(lines, exact=False):
+    """Parse the intervals from each non-blank line into an IntervalArray.
+
+        >>> list(parse_array(['[1, 2]', '3']).endpoints)
+        [1.0, 2.0, 3.0, 3.0]
+
+    """
+    from .storage import IntervalArray
+    return IntervalArray.from_intervals(iterparse(lines, exact))
+
+
+def format_all(intervals, fs='%r'):
+    """Format each interval of an iterable into a string, as interval.format does.
+
+        >>> format_all([interval[1, 2], interval[0.1], interval()], '%g')
+        ['interval([1, 2])', 'interval([0.1])', 'interval()']
+
+    The default format is that of repr, which writes the shortest
+    string that is parsed back to the same float.
+    """
+    return list(_format(intervals, fs, ''))
+
+
+def dump(intervals, file, fs='%r'):
+    """Write each interval of an iterable on a line of a text file.
+
+    The output can be read back with iterparse, with exact=True if fs
+    is the default format:
+
+        >>> import io
+        >>> f = io.StringIO()
+        >>> dump([interval[0.1, 0.2], interval(1, [2, 3])], f)
+        >>> print(f.getvalue().rstrip())
+        interval([0.1, 0.2])
+        interval([1.0], [2.0, 3.0])
+        >>> _ = f.seek(0)
+        >>> list(iterparse(f, exact=True)) == [interval[0.1, 0.2], interval(1, [2, 3])]
+        True
+
+    """
+    file.writelines(text_type(line) for line in _format(intervals, fs, '\n'))
+
+
+def _format(intervals, fs, end):
+    "Iterate on the formatted intervals, followed by end."
+    one, two = '[' + fs + ']', '[' + fs + ', ' + fs + ']'
+    cls = prefix = None
+    for x in intervals:
+        if type(x) is not cls:
+            cls = type(x)
+            prefix = cls.__name__ + '('
+        if len(x) == 1:
+            c = x[0]
+            yield prefix + (one % c[0] if c[0] == c[1] else two % c) + ')' + end
+        else:
+            yield prefix + ', '.join([one % c[0] if c[0] == c[1] else two % c for c in x]) + ')' + end
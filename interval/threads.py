@@ -0,0 +1,35 @@
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+"""\
+``interval.threads`` --- Interval computations on threads
+---------------------------------------------------------
+
+Since the rounding mode is controlled separately in each thread,
+interval functions can be evaluated on a pool of threads:
+
+    >>> from interval import interval, imath
+    >>> thread_map(imath.exp, [interval[0, 1], interval[1, 2]], workers=2)[1].format('%.4f')
+    'interval([2.7183, 7.3891])'
+
+Threads share the global interpreter lock, so that they run
+concurrently only while a function releases it, e.g., while waiting
+for I/O or in extensions. Otherwise a pool of processes is faster.
+"""
+
+
+def thread_map(f, iterable, workers=None, chunksize=1):
+    """Apply f to each element of an iterable on a pool of threads, returning the list of the results.
+
+    The number of threads defaults to the number of CPUs. The
+    elements are submitted to the threads in chunks of chunksize. An
+    exception raised by f is raised again in the calling thread.
+    """
+    from multiprocessing.pool import ThreadPool
+    pool = ThreadPool(workers)
+    try:
+        return pool.map(f, iterable, chunksize)
+    finally:
+        pool.close()
+        pool.join()
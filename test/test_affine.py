@@ -0,0 +1,67 @@
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+import unittest
+
+from interval import interval, imath, fpu, affine as amath
+from interval.affine import affine
+
+
+class AffineTestCase(unittest.TestCase):
+
+    def test_constructor(self):
+        x = affine(interval[1, 3])
+        assert x.center == 2 and list(x.terms.values()) == [1]
+        assert affine(x) is x
+        assert affine(2).terms == {}
+        assert affine(interval([1, 2], [5, 6])).hull == interval[1, 6]
+        assert affine(interval[1, fpu.infinity]).hull == interval[-fpu.infinity, fpu.infinity]
+        self.assertRaises(affine.EmptyError, lambda: affine(interval()))
+        self.assertRaises(interval.ScalarError, lambda: affine('a'))
+
+    def test_symbols(self):
+        x, y = affine(interval[1, 2]), affine(interval[1, 2])
+        assert (x - x).hull == interval[0]
+        assert (x - y).hull == interval[-1, 1]
+
+    def test_interoperability(self):
+        x = affine(interval[1, 2])
+        assert (x + interval[0, 1]).hull == interval[1, 3]
+        assert (interval[0, 1] + x).hull == interval[1, 3]
+        assert interval[0, 2] in (interval[0, 1] * x).hull
+        assert (2 * x - x).hull == interval[1, 2]
+        assert (x + 1 - x).hull == interval[1]
+        self.assertRaises(TypeError, lambda: x + 1j)
+
+    def test_rounding(self):
+        x = affine(interval[1, 2])
+        assert interval[1, 2] / 3 in (x / 3).hull
+        assert 0.1 * interval[1, 2] in (0.1 * x).hull
+        assert interval[1, 32] in (x ** 5).hull
+        assert (interval[1.1, 2.1]) ** -3 in ((x + 0.1) ** -3).hull
+        assert interval[1] / 3 in (affine(1) / 3).hull
+
+    def test_dependency(self):
+        x = affine(interval[1, 2])
+        assert (x * (3 - x)).hull == interval[2, 2.5]
+        z = x
+        for i in range(20):
+            z = z * 1.01 - x * 0.01
+        assert interval[1, 2] in z.hull
+        assert z.hull in interval[1 - 1e-12, 2 + 1e-12]
+
+    def test_functions(self):
+        x = affine(interval[1, 2])
+        for name in 'exp expm1 log log2 log10 log1p sqrt atan atanpi sinh cosh tanh sin cos tan sinpi cospi tanpi'.split():
+            f = getattr(imath, name)
+            y = getattr(amath, name)(x)
+            assert f(interval[1]) in y.hull and f(interval[2]) in y.hull and f(interval[1.5]) in y.hull, name
+        assert 1 in (amath.sin(x) ** 2 + amath.cos(x) ** 2).hull
+        assert amath.exp(interval[0, 1]) == imath.exp(interval[0, 1])
+
+    def test_domain(self):
+        assert amath.log(affine(interval[-1, 2])).hull == interval[-fpu.infinity, fpu.infinity]
+        assert amath.tan(affine(interval[1, 2])).hull == interval[-fpu.infinity, fpu.infinity]
+        self.assertRaises(affine.EmptyError, lambda: amath.log(affine(interval[-2, -1])))
+        assert (1 / affine(interval[-1, 1])).hull == interval[-fpu.infinity, fpu.infinity]
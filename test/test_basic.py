@@ -2,6 +2,7 @@
 # All rights reserved.
 # See LICENSE for details.
 
+import sys
 import unittest
 from interval import interval, fpu
 
@@ -74,13 +75,47 @@ class FpuTestCase(unittest.TestCase):
         assert fpu.power_rd(-x, 4) < fpu.power_ru(-x, 4)
 
         assert (fpu.down(lambda: x * x * x), fpu.up(lambda: x * x * x)) == (fpu.power_rd(x, 3), fpu.power_ru(x, 3))
+        assert fpu.power_bounds([(x, x), (-x, -x), (x, -x)], 3) == [
+            (fpu.power_rd(x, 3), fpu.power_ru(x, 3)), (fpu.power_rd(-x, 3), fpu.power_ru(-x, 3)),
+            (fpu.power_rd(x, 3), fpu.power_ru(-x, 3))]
+        assert fpu.power_bounds([(-x, x)], 4) == [(fpu.power_rd(-x, 4), fpu.power_ru(x, 4))]
+        assert fpu.power_bounds([(x, x)], 0) == [(1.0, 1.0)]
 
 
 class ModuleTestCase(unittest.TestCase):
 
     def test_namespace(self):
         import interval
-        assert [x for x in dir(interval) if not x.startswith('__')] == ['fpu', 'imath', 'inf', 'interval']
+        import types
+
+        def submodule(x):
+            "True for the submodules, which are bound as well when imported by other tests."
+            value = getattr(interval, x)
+            return isinstance(value, types.ModuleType) and value.__name__ == 'interval.' + x
+        assert [x for x in dir(interval) if not x.startswith('__') and not submodule(x)] == [
+            '_from_bytes', 'inf', 'interval']
+        assert set(['fpu', 'imath', 'memo']) <= set(dir(interval))
+
+    def test_star_import(self):
+        namespace = {}
+        exec('from interval import *', namespace)
+        assert set(namespace) - set(['__builtins__']) == set(['fpu', 'imath', 'inf', 'interval'])
+        namespace = {}
+        exec('from interval.imath import *', namespace)
+        assert 3.14159 < namespace['pi'][0].sup < 3.1416
+        assert namespace['exp'](1) == namespace['e']
+        assert set(['crlibm', 'fpu', 'interval']) <= set(namespace)
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'imath is imported eagerly')
+    def test_lazy_imath(self):
+        import subprocess
+        script = (
+            'import sys, interval\n'
+            'assert "interval.imath" not in sys.modules and "crlibm" not in sys.modules\n'
+            'from interval import imath\n'
+            'assert "pi" not in vars(imath)\n'
+            'assert imath.pi is imath.pi and 3.14159 < imath.pi[0].sup < 3.1416 and 2.71828 < interval.imath.e[0].inf < 2.7183\n')
+        subprocess.check_call([sys.executable, '-c', script])
 
 
 class IntervalTestCase(unittest.TestCase):
@@ -173,6 +208,21 @@ class IntervalTestCase(unittest.TestCase):
         assert interval[-1, 2]                       == (interval[-1, 2] ** -1) ** -1
         assert interval([-0.38712442133802405]) ** 3 == interval([-0.058016524353106828, -0.058016524353106808])
 
+        assert interval[1]                           == interval[-1, 2] ** 0
+        assert interval()                            == interval() ** 0
+        assert interval(-fpu.infinity, [0.25, fpu.infinity]) == interval[-1, 2] ** -2
+        assert interval([-fpu.infinity, -1], [0.125, fpu.infinity]) == interval[-1, 2] ** -3
+        assert interval[1 / 9.0, 0.25]               == interval[-3, -2] ** -2
+        for x in interval([-3, -1], [0.5, 2]), interval[-0.3, 1e200], interval[-fpu.infinity, 0]:
+            for n in 1, 3, 5, 7:
+                assert x ** n == interval.union(interval[fpu.power_rd(c.inf, n), fpu.power_ru(c.sup, n)] for c in x)
+                assert x ** -n == (x ** n).inverse()
+            for n in 2, 4, 6:
+                assert x ** n == interval.union(interval.hull(
+                    (interval[0] if c.inf <= 0 <= c.sup else interval(), interval[fpu.power_rd(c.inf, n), fpu.power_ru(c.inf, n)],
+                     interval[fpu.power_rd(c.sup, n), fpu.power_ru(c.sup, n)])) for c in x)
+                assert x ** -n == (x ** n).inverse()
+
         from operator import truediv
         assert (
             interval[
@@ -191,6 +241,10 @@ class IntervalTestCase(unittest.TestCase):
             assert x == eval(repr(x))
         x = interval([1, 2])
         assert str(x) == repr(x)
+        assert repr(interval(1, [2, 3])) == 'interval([1.0], [2.0, 3.0])'
+        assert interval[-0.0, 0.0].format('%g') == 'interval([-0])'
+        assert interval[0.5, 2].format('%%%.1f%%') == 'interval([%0.5%, %2.0%])'
+        assert interval().format('%g') == 'interval()'
 
     def test_intersection(self):
         assert interval[1, 2] & interval[0, 3]             == interval[1, 2]
@@ -207,6 +261,40 @@ class IntervalTestCase(unittest.TestCase):
         assert 2.1 | interval[1, 2] == interval([1, 2], 2.1)
         self.assertRaises(TypeError, lambda: interval[1, 2] | 1j)
 
+    def test_difference(self):
+        inf = fpu.infinity
+        assert interval([0, 4], [6, 8]).difference(interval([1, 2], [3, 7])) == interval([0, 1], [2, 3], [7, 8])
+        assert interval[0, 2].difference(1)                                 == interval[0, 2]
+        assert interval[0, 5].difference(interval(1, 2, 3))                 == interval[0, 5]
+        assert interval(1).difference(interval[1, 2])                       == interval()
+        assert interval(1, 3).difference(interval[2, 4])                    == interval(1)
+        assert interval[0, 1].difference(interval[1, 2])                    == interval[0, 1]
+        assert interval[-inf, inf].difference(interval[-inf, 0])            == interval[0, inf]
+        assert interval[1, 2].difference(interval())                        == interval[1, 2]
+        assert interval().difference(interval[1, 2])                        == interval()
+        assert interval[inf].difference(interval())                         == interval[inf]
+        assert interval(-inf, [0, 1]).difference(interval[5])               == interval(-inf, [0, 1])
+        assert interval(-inf, inf).difference(interval[0, inf])             == interval[-inf]
+        assert interval(-inf, inf).difference(interval[-inf, 0])            == interval[inf]
+        self.assertRaises(interval.ScalarError, lambda: interval[1, 2].difference(1j))
+
+    def test_complement(self):
+        inf = fpu.infinity
+        assert interval().complement()                 == interval[-inf, inf]
+        assert interval[-inf, inf].complement()        == interval()
+        assert interval(1).complement()                == interval[-inf, inf]
+        assert interval([-inf, 0], [1, 2]).complement() == interval([0, 1], [2, inf])
+        assert interval([0, 1], [2, 3]).complement().complement() == interval([0, 1], [2, 3])
+        assert interval(-inf, [0, 1]).complement()     == interval([-inf, 0], [1, inf])
+
+    def test_symmetric_difference(self):
+        assert interval[0, 2].symmetric_difference(interval[1, 3])          == interval([0, 1], [2, 3])
+        assert interval[0, 2].symmetric_difference(interval[0, 2])          == interval()
+        assert interval(1, [3, 4]).symmetric_difference(interval[0, 5])     == interval([0, 3], [4, 5])
+        assert interval[0, 1].symmetric_difference(interval[2, 3])          == interval([0, 1], [2, 3])
+        assert interval[-fpu.infinity].symmetric_difference(interval[3])    == interval(-fpu.infinity, 3)
+        assert interval[3].symmetric_difference(interval[fpu.infinity])     == interval(3, fpu.infinity)
+
     def test_abs(self):
         assert interval([0, 3])     == abs(interval[-3, 2])
         assert interval([1, 6], 9)  == abs(interval([-9], [-5, -2], [1, 3], [4, 6]))
@@ -252,6 +340,59 @@ class IntervalTestCase(unittest.TestCase):
         assert a == pickle.loads(pickle.dumps(a, -1))
         assert a == copy.copy(a)
         assert a == copy.deepcopy(a)
+        for x in interval(), interval[fpu.infinity], interval([-fpu.infinity, 0], 1, [3, fpu.infinity]):
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                y = pickle.loads(pickle.dumps(x, protocol))
+                assert y == x and type(y) is interval and all(type(c) is interval.Component for c in y)
+
+    def test_bytes(self):
+        import struct
+        x = interval([-fpu.infinity, -1], [0.5, 2], 3)
+        assert x.to_bytes() == struct.pack('<Q6d', 3, -fpu.infinity, -1, 0.5, 2, 3, 3)
+        assert interval.from_bytes(x.to_bytes()) == x
+        assert interval.from_bytes(x.to_bytes())[1].sup == 2
+        assert interval.from_bytes(interval().to_bytes()) == interval()
+        assert interval.from_bytes(x.to_bytes() + b'trailing') == x
+
+    def test_monotonic_function(self):
+        @interval.function(increasing=[False, True], breakpoints=[0.5])
+        def f(c):
+            x = interval.new((c,))
+            return x * x - x
+        assert f(interval[0, 2]) == interval[-0.25, 2]
+        assert f(interval([-1, 0], [1, 2])) == interval([0, 2])
+        assert f(interval[1, 2]) == interval[0, 2]
+        assert f(interval()) == interval()
+        assert f(2) == interval[2]
+
+        # Both the image and the enclosure are rigorous
+        g = interval.function(lambda c: interval.new((c,)).inverse(), increasing=False)
+        x = interval[3, 7]
+        assert g(x) == x.inverse() and g(x)[0].inf <= 1 / 7.0 < 1 / 3.0 < g(x)[0].sup
+
+        h = interval.function(lambda c: (c,), increasing=True, rd=lambda x: x - 1, ru=lambda x: x + 1)
+        assert h(interval([0, 1], [5, 6])) == interval([-1, 2], [4, 7])
+
+        # Empty images at the endpoints
+        from interval import imath
+        log = interval.function(lambda c: imath.log(interval.new((c,))), increasing=True)
+        assert log(interval[-1, 1]) == imath.log(interval[-1, 1])
+        assert log(interval([-2, -1], [1, 2])) == imath.log(interval[1, 2])
+
+    def test_monotonicity_check(self):
+        def f(c):
+            x = interval.new((c,))
+            return x * x
+        square = interval.function(f)
+        g = interval.function(f, increasing=[False, True], breakpoints=[0], derivative=lambda x: 2 * x)
+        assert g(interval[-1, 2]) == interval[0, 4]
+        g = interval.function(f, increasing=True, derivative=lambda x: 2 * x)
+        assert g(interval[1, 2]) == interval[1, 4]
+        assert g(interval[-1, 2]) == square(interval[-1, 2])
+        self.assertRaises(interval.MonotonicityError, g, interval[-2, -1])
+        g = interval.function(f, increasing=False, derivative=lambda x: interval())
+        assert g(interval[1, 2]) == interval[1, 4]
+        self.assertRaises(ValueError, interval.function, f, increasing=[True], breakpoints=[0])
 
 
 class NewtonTestCase(unittest.TestCase):
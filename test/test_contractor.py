@@ -0,0 +1,69 @@
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+import unittest
+
+from interval import interval, imath, fpu
+from interval import contractor
+from interval.contractor import hc4
+from interval.paving import paving, sivia
+
+
+def ring(x, y):
+    return x ** 2 + y ** 2
+
+
+class HC4TestCase(unittest.TestCase):
+
+    def test_arithmetic(self):
+        c = hc4(lambda x, y: x * y - x / y, interval[0])
+        assert c((interval[1, 2], interval[2, 3])) == (interval(), interval())
+        c = hc4(lambda x, y: 2 * x - y, interval[0])
+        assert c((interval[0, 10], interval[-1, 1])) == (interval[0, 0.5], interval[0, 1])
+        c = hc4(lambda x: -x + 1, interval[0, 1])
+        assert c((interval[-5, 5],)) == (interval[0, 1],)
+
+    def test_power(self):
+        assert hc4(lambda x: x ** 2, interval[1, 4])((interval[-5, 5],)) == (interval([-2, -1], [1, 2]),)
+        assert hc4(lambda x: x ** 2, interval[1, 4])((interval[0, 5],)) == (interval[1, 2],)
+        assert hc4(lambda x: x ** 2, interval[-4, -1])((interval[-5, 5],)) == (interval(),)
+        y, = hc4(lambda x: x ** -1, interval[1, 2])((interval[-5, 5],))
+        assert interval[0.5, 1] in y and y in interval[0.499, 1.001]
+        assert hc4(lambda x: x ** 0, interval[2])((interval[-5, 5],)) == (interval(),)
+        y, = hc4(lambda x: x ** 3, interval[-8, 27])((interval[-100, 100],))
+        assert interval[-2, 3] in y and y in interval[-2.001, 3.001]
+
+    def test_functions(self):
+        for f, g in [(contractor.exp, contractor.log), (contractor.expm1, contractor.log1p), (contractor.sqrt, lambda x: x ** 2)]:
+            y, = hc4(f, interval[1, 2])((interval[-10, 10],))
+            assert g(interval[1]) in y and g(interval[2]) in y
+            assert y in g(interval[0.999, 2.001])
+        assert hc4(contractor.log, interval[0, 1])((interval[-10, 10],)) == (imath.exp(interval[0, 1]),)
+        assert contractor.exp(interval[1]) == imath.exp(1)
+
+    def test_trigonometric(self):
+        y, = hc4(contractor.sin, interval[0.5, 1])((interval[0, 3],))
+        assert interval[0.53, 2.61] in y and y in interval[0.52, 2.62]
+        y, = hc4(contractor.cos, interval[0.5, 1])((interval[-10, 10],))
+        assert len(y) == 3 and 1.047 in y and -1.047 in y and 1.048 not in y
+        y, = hc4(contractor.sin, interval[2])((interval[0, 3],))
+        assert y == interval()
+        assert hc4(contractor.sin, interval[0.5])((interval[-fpu.infinity, 0],)) == (interval[-fpu.infinity, 0],)
+
+    def test_shared(self):
+        def f(x):
+            s = x + 1
+            return s ** 2, s
+        assert hc4(f, (interval[4], interval[0, 10]))((interval[-10, 10],)) == (interval[1],)
+
+    def test_sivia(self):
+        box = (interval[-3, 3], interval[-3, 3])
+        p = sivia(ring, box, interval[1, 4], maxdepth=8)
+        q = sivia(ring, box, interval[1, 4], maxdepth=8, contractor=hc4(ring, interval[1, 4]))
+
+        def area(box):
+            return (box[0][0].sup - box[0][0].inf) * (box[1][0].sup - box[1][0].inf)
+        assert sum(map(area, q.boxes(paving.BOUNDARY))) < sum(map(area, p.boxes(paving.BOUNDARY))) / 2
+        for point in (1.5, 0), (0, 0), (2.5, 2.5), (-1, -1):
+            assert q.classify(point) == p.classify(point) != paving.BOUNDARY
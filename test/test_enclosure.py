@@ -0,0 +1,127 @@
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+import unittest
+
+from interval import interval, imath, inf
+from interval.enclosure import centered, range_enclosure
+
+
+class RangeEnclosureTestCase(unittest.TestCase):
+
+    def test_tolerance(self):
+        def f(x):
+            return x * (3 - x)
+        for tol in 0.1, 1e-3, 1e-4:
+            y = range_enclosure(f, interval[1, 2], tol)
+            assert interval[2, 2.25] in y
+            assert y[0].inf >= 2 - tol and y[-1].sup <= 2.25 + tol
+
+    def test_exact(self):
+        assert range_enclosure(lambda x: 2 * x, interval[1, 2], 0.1) == interval[2, 4]
+        assert range_enclosure(lambda x: 2 * x, interval(1, [3, 4]), 0.1) == interval(2, [6, 8])
+        assert range_enclosure(lambda x: 2 * x, interval(), 0.1) == interval()
+
+    def test_discontinuous(self):
+        assert range_enclosure(lambda x: 1 / x, interval[-1, 1], 0.1) == interval([-inf, -1], [1, inf])
+        assert range_enclosure(imath.log, interval[-2, -1], 0.1) == interval()
+
+    def test_unbounded(self):
+        assert range_enclosure(lambda x: x ** 2, interval[-1, inf], 0.1) == interval[0, inf]
+        assert range_enclosure(lambda x: x ** 2, interval[-inf, inf], 0.1) == interval[0, inf]
+
+    def test_maxdepth(self):
+        def f(x):
+            return x * (3 - x)
+        assert range_enclosure(f, interval[1, 2], 1e-9, maxdepth=0) == f(interval[1, 2])
+        assert range_enclosure(f, interval[1, 2], 1e-9, maxdepth=1) == f(interval[1, 1.5]) | f(interval[1.5, 2])
+
+    def test_cache(self):
+        calls = []
+
+        def f(x):
+            calls.append(x)
+            return x * (3 - x)
+
+        cache = {}
+        y = range_enclosure(f, interval[1, 2], 1e-3, cache=cache)
+        assert len(calls) == len(set(calls)) == len(cache)
+        del calls[:]
+        assert y == range_enclosure(f, interval[1, 2], 1e-3, cache=cache)
+        assert calls == []
+
+    def test_batch(self):
+        def f(x):
+            return imath.sin(x) * imath.cos(x)
+        batches = []
+
+        def g(xs):
+            batches.append(len(xs))
+            return [f(x) for x in xs]
+
+        assert range_enclosure(g, interval[0, 3], 1e-4, batch=True) == range_enclosure(f, interval[0, 3], 1e-4)
+        assert 1 < len(batches) < sum(batches)
+
+
+class CenteredTestCase(unittest.TestCase):
+
+    f = staticmethod(lambda x: x * (3 - x))
+    p = staticmethod(lambda x: 3 - 2 * x)
+
+    def test_enclosure(self):
+        g = centered(self.f, self.p)
+        for x in interval[1.4, 1.6], interval[0, 3], interval[-1, 0.5]:
+            y = g(x)
+            assert y in self.f(x)
+            assert all(self.f(interval[t]) in y for t in (x[0].inf, x[0].sup, x.midpoint[0].inf))
+
+    def test_quadratic(self):
+        g = centered(self.f, self.p)
+        for w in 0.1, 0.01, 0.001:
+            x = interval[1 - w, 1 + w]
+
+            def overestimation(y):
+                return y[0].sup - y[0].inf - 2 * w
+            assert overestimation(g(x)) < 10 * w * w < overestimation(self.f(x))
+
+    def test_components(self):
+        g = centered(self.f, self.p)
+        assert g(interval([1, 1.1], 2, [3, inf])) == g(interval[1, 1.1]) | self.f(interval(2, [3, inf]))
+        assert g(interval()) == interval()
+
+    def test_huge(self):
+        # The naive form of x - x is wide, and the midpoint must not overflow
+        g = centered(lambda x: x - x, lambda x: interval[0])
+        assert g(interval[1.5e308, 1.7e308]) == interval[0]
+        assert g(interval[-1e308, 1.7e308]) == interval[0]
+
+    def test_partial(self):
+        from functools import partial
+        from operator import mul
+        g = centered(partial(mul, 2), partial(lambda a, x: a, interval[2]))
+        assert g(interval[1, 2]) == interval[2, 4]
+
+    def test_batch(self):
+        g = centered(lambda xs: [self.f(x) for x in xs], lambda xs: [self.p(x) for x in xs], batch=True)
+        xs = [interval[1.4, 1.6], interval([0, 1], 2)]
+        assert g(xs) == [centered(self.f, self.p)(x) for x in xs]
+
+    def test_range_enclosure(self):
+        calls = []
+
+        def f(x):
+            calls.append(x)
+            return self.f(x)
+
+        y = range_enclosure(f, interval[1, 2], 1e-6, p=self.p)
+        assert interval[2, 2.25] in y
+        assert y[0].inf >= 2 - 1e-6 and y[-1].sup <= 2.25 + 1e-6
+        assert len(calls) < 1000
+
+    def test_newton_exclusion(self):
+        messages = []
+        assert interval() == interval[3, 4].newton(
+            lambda x: x ** 2 - 2, lambda x: 2 * x,
+            tracer_cb=lambda tag, interval: messages.append((tag, interval)))
+        assert messages == [('branch', interval[3, 4]), ('exclude', interval[3, 4])]
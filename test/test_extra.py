@@ -111,6 +111,9 @@ class ImathTestcase(unittest.TestCase):
         assert imath.log(interval[0, 1])   == interval[-fpu.infinity, 0]
         assert imath.log(interval[-1, 1])  == interval[-fpu.infinity, 0]
         assert imath.log(interval[-2, -1]) == interval()
+        assert imath.log(interval([-2, -1], [0.5, 1], 4)) == imath.log(interval[0.5, 1]) | imath.log(4)
+        assert imath.log(interval([-2, 0], [1, 2]))        == interval[-fpu.infinity] | imath.log(interval[1, 2])
+        assert imath.log(interval())                       == interval()
 
     def test_log2(self):
         assert imath.log2(2)               == interval[1]
@@ -158,6 +161,42 @@ class ImathTestcase(unittest.TestCase):
         assert imath.sqrt(interval[-1, 4])                        == interval([0.0, 2])
         assert imath.sqrt(interval([-3.14, 2], [4, 9], [25, 64])) == interval([0, 1.4142135623730951], [2, 3], [5, 8])
 
+    def test_pow(self):
+        assert imath.pow(interval[-2, 3], 2)                 == interval[-2, 3] ** 2
+        assert imath.pow(interval[-2, 3], interval[-1])      == interval[-2, 3] ** -1
+        assert imath.pow(interval[-3, -1], 0.5)              == interval()
+        assert imath.pow(interval[1], interval[-1.5, 2.5])   == interval[1]
+        assert imath.pow(interval[1, 4], 0)                  == interval[1]
+        assert interval[0, 2] in imath.pow(interval[0, 4], 0.5)
+        assert imath.pow(0, -0.5)                            == interval[fpu.infinity]
+        assert imath.pow(interval[0, 2], interval[-1, 1])    == interval[0, fpu.infinity]
+        assert imath.pow(fpu.infinity, interval[0, 1])       == interval[1, fpu.infinity]
+        x, y = interval([0.5, 2], [3, 4]), interval([-1.7, -0.3], [0.25, 1.7])
+        z = imath.pow(x, y)
+        assert z in imath.exp(y * imath.log(x))
+        for a in 0.5, 1.1, 2, 3, 3.5, 4:
+            for b in -1.7, -1, -0.3, 0.25, 1.2, 1.7:
+                assert a ** b in z
+        for a, b in (2, 0.5), (10, 1.7), (0.3, -2.5), (1e-3, 0.3):
+            z = imath.pow(a, b)
+            assert z[0].inf <= a ** b <= z[0].sup and z[0].sup - z[0].inf <= 16 * a ** b * 2 ** -52
+
+    def test_root(self):
+        assert imath.root(interval([-27, -8], [16, 81]), 3)[0] == (-3, -2)
+        assert imath.root(interval[-1, 16], 4)                == interval[0, 2]
+        assert imath.root(interval[-16, -1], 4)               == interval()
+        assert imath.root(interval[0, fpu.infinity], 5)       == interval[0, fpu.infinity]
+        assert imath.root(2, 2)                               == imath.sqrt(2)
+        assert imath.root(interval[4, 9], -2)                 == interval[1 / 3.0, 0.5]
+        assert imath.root(interval[4, 9], 1)                  == interval[4, 9]
+        assert imath.root(2 ** -1074, 3)                      == interval[2 ** -358]
+        for x, n in (2, 3), (1e300, 7), (1e-300, 5), (1e308, 100), (0.7, 6):
+            r = imath.root(x, n)
+            assert x in r ** n
+            assert r[0].sup - r[0].inf <= 4 * r[0].sup * 2 ** -52
+        self.assertRaises(ValueError, imath.root, 2, 0)
+        self.assertRaises(ValueError, imath.root, 2, 0.5)
+
     def test_tanh(self):
         tanh = imath.tanh
         inf = fpu.infinity
@@ -228,6 +267,20 @@ class ImathTestcase(unittest.TestCase):
         assert imath.cos(imath.pi / interval[3]) == interval[helpers.nudge(0.5, -6), helpers.nudge(0.5, 1)]
         assert imath.tan(imath.pi / 4)           == interval[helpers.nudge(1, -1), helpers.nudge(1, +1)]
 
+    def test_sincos(self):
+        from interval import memo
+        for x in (0, interval[0.5, 1], interval[-1, 2], interval([-7, -6], [1, 1.5], [3, 20]), interval(),
+                  imath.pi / 2, interval[-inf, 0], interval[inf]):
+            assert imath.sincos(x)   == (imath.sin(x), imath.cos(x))
+            assert imath.sincospi(x) == (imath.sinpi(x), imath.cospi(x))
+        memo.enable()
+        try:
+            for i in range(2):
+                assert imath.sincos(interval([1, 2], 4)) == (imath.sin(interval([1, 2], 4)), imath.cos(interval([1, 2], 4)))
+            assert memo.info().hits > 0
+        finally:
+            memo.disable()
+
     def test_constants(self):
         assert helpers.issharp(imath.pi)
         assert helpers.issharp(imath.e)
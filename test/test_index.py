@@ -0,0 +1,56 @@
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+import random
+import unittest
+
+from interval import interval, fpu
+from interval.index import IntervalIndex
+
+
+def brute_overlap(intervals, x):
+    return [i for i, y in enumerate(intervals) if any(a.inf <= b.sup and b.inf <= a.sup for a in y for b in x)]
+
+
+class IndexTestCase(unittest.TestCase):
+
+    def random_intervals(self, rng, n):
+        result = []
+        for i in range(n):
+            k = rng.randint(0, 3)
+            result.append(interval(*[[a, a + rng.expovariate(0.5)] for a in [rng.uniform(-100, 100) for j in range(k)]]))
+        return result
+
+    def test_bulk(self):
+        rng = random.Random(42)
+        intervals = self.random_intervals(rng, 500)
+        index = IntervalIndex(intervals)
+        assert len(index) == 500 and list(index) == intervals
+        for j in range(200):
+            p = rng.uniform(-110, 110)
+            assert index.stab(p) == brute_overlap(intervals, interval[p])
+            x = self.random_intervals(rng, 1)[0]
+            assert index.overlap(x) == brute_overlap(intervals, x)
+
+    def test_incremental(self):
+        rng = random.Random(7)
+        intervals = self.random_intervals(rng, 300)
+        index = IntervalIndex(intervals[:100])
+        for i, x in enumerate(intervals[100:200]):
+            assert index.add(x) == 100 + i
+        index.extend(intervals[200:])
+        assert len(index._blocks) < 10
+        for j in range(200):
+            x = self.random_intervals(rng, 1)[0]
+            assert index.overlap(x) == brute_overlap(intervals, x)
+
+    def test_endpoints(self):
+        index = IntervalIndex([interval[1, 2], interval[2, 3], interval[3], interval[-fpu.infinity, 0], interval()])
+        assert index.stab(2) == [0, 1]
+        assert index.stab(3) == [1, 2]
+        assert index.stab(-1e300) == [3]
+        assert index.stab(0) == [3]
+        assert index.overlap(interval()) == []
+        assert index.overlap(interval([0, 1], [3, 4])) == [0, 1, 2, 3]
+        assert IntervalIndex().stab(1) == []
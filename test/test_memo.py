@@ -0,0 +1,71 @@
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+import random
+import unittest
+
+from interval import interval, imath, memo
+
+
+class MemoTestCase(unittest.TestCase):
+
+    def setUp(self):
+        memo.enable(maxsize=100)
+
+    def tearDown(self):
+        memo.disable()
+
+    def test_values(self):
+        rng = random.Random(5)
+        xs = [interval([a, a + rng.random()], rng.uniform(-5, 5)) for a in [rng.uniform(-5, 5) for i in range(50)]]
+        functions = [imath.exp, imath.log, imath.cos, imath.tanpi, imath.tanh, interval.inverse]
+        cached = [[f(x) for f in functions] for x in xs + xs]
+        memo.disable()
+        assert cached == [[f(x) for f in functions] for x in xs + xs]
+
+    def test_statistics(self):
+        calls = []
+
+        @interval.function
+        def f(c):
+            calls.append(c)
+            return (c.inf - 1, c.sup + 1),
+        assert f(interval([1, 2], 5)) == interval([0, 3], [4, 6])
+        assert f(interval[1, 2]) == interval[0, 3]
+        assert len(calls) == 2
+        assert memo.info() == memo.CacheInfo(hits=1, misses=2, maxsize=100, currsize=2)
+        memo.clear()
+        assert memo.info() == memo.CacheInfo(hits=0, misses=0, maxsize=100, currsize=0)
+
+    def test_eviction(self):
+        for i in range(1, 251):
+            imath.exp(interval[i])
+        assert memo.info().currsize == 100
+        imath.exp(interval[251])
+        imath.exp(interval[250])
+        assert memo.info().hits == 1
+        imath.exp(interval[1])
+        assert memo.info().hits == 1
+        memo.enable(maxsize=10)
+        assert memo.info().currsize == 10
+        imath.exp(interval[250])
+        assert memo.info().hits == 2
+
+    def test_recency(self):
+        memo.enable(maxsize=3)
+        for i in 1, 2, 3, 1, 4, 1, 3, 2:
+            imath.exp(interval[i])
+        # The value at 2 is evicted by 4, being the least recently used
+        assert memo.info() == memo.CacheInfo(hits=3, misses=5, maxsize=3, currsize=3)
+
+    def test_signed_zero(self):
+        x, y = interval.inverse(interval[-0.0, 1]), interval.inverse(interval[0.0, 1])
+        assert memo.info().currsize == 0
+        memo.disable()
+        assert (x, y) == (interval.inverse(interval[-0.0, 1]), interval.inverse(interval[0.0, 1]))
+
+    def test_disabled(self):
+        memo.disable()
+        imath.exp(interval[1])
+        assert memo.info() == memo.CacheInfo(hits=0, misses=0, maxsize=100, currsize=0)
@@ -0,0 +1,82 @@
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+import unittest
+
+from interval import interval, fpu
+from interval.paving import paving, sivia
+
+
+def ring(x, y):
+    return x ** 2 + y ** 2
+
+
+def clip(box):
+    return tuple(x & interval[-2, 2] for x in box)
+
+
+class SiviaTestCase(unittest.TestCase):
+
+    box = (interval[-3, 3], interval[-3, 3])
+
+    def check_ring(self, p):
+        assert p.classify((1.5, 0)) == paving.INSIDE
+        assert p.classify((0, -1.5)) == paving.INSIDE
+        assert p.classify((0, 0)) == paving.OUTSIDE
+        assert p.classify((2.5, 2.5)) == paving.OUTSIDE
+        assert p.classify((5, 0)) == paving.OUTSIDE
+        assert p.classify((1, 0)) != paving.OUTSIDE
+        for box in p.boxes(paving.INSIDE):
+            assert ring(*box) in interval[1, 4]
+
+    def test_ring(self):
+        p = sivia(ring, self.box, interval[1, 4], maxdepth=10)
+        self.check_ring(p)
+        for box in p.boxes(paving.OUTSIDE):
+            assert not ring(*box) & interval[1, 4]
+        labels = [label for box, label in p.boxes()]
+        assert len(labels) == (len(p) + 1) // 2
+        assert set(labels) == set((paving.INSIDE, paving.OUTSIDE, paving.BOUNDARY))
+
+    def test_limits(self):
+        assert len(sivia(ring, self.box, interval[1, 4], maxdepth=0)) == 1
+        coarse = sivia(ring, self.box, interval[1, 4], eps=1.0)
+        assert all(x[0].sup - x[0].inf > 0.5 for box in coarse.boxes(paving.BOUNDARY) for x in box)
+        assert len(sivia(ring, self.box, interval[-2, -1])) == 1
+        assert list(sivia(ring, self.box, interval[0, 18]).boxes()) == [(self.box, paving.INSIDE)]
+
+    def test_vector(self):
+        p = sivia(lambda x, y: (ring(x, y), x), self.box, (interval[1, 4], interval[0, 3]), maxdepth=10)
+        assert p.classify((1.5, 0)) == paving.INSIDE
+        assert p.classify((-1.5, 0)) == paving.OUTSIDE
+
+    def test_contractor(self):
+        p = sivia(ring, self.box, interval[1, 4], maxdepth=10, contractor=clip)
+        self.check_ring(p)
+        assert p.classify((2.5, 0)) == p.classify((0, -2.5)) == paving.OUTSIDE
+        assert p.classify((2, 0)) != paving.OUTSIDE
+        q = sivia(ring, self.box, interval[1, 4], maxdepth=10, contractor=lambda box: (interval(), interval()))
+        assert list(q.boxes()) == [(self.box, paving.OUTSIDE)]
+
+    def test_unbounded(self):
+        p = sivia(lambda x: x, (interval[0, fpu.infinity],), interval[1, 2])
+        assert p.classify((1.5,)) == paving.BOUNDARY
+
+    def test_serialization(self):
+        p = sivia(ring, self.box, interval[1, 4], maxdepth=10, contractor=clip)
+        data = p.to_bytes()
+        q = paving.from_bytes(data)
+        assert q.box == p.box
+        assert list(q.boxes()) == list(p.boxes())
+        assert q.to_bytes() == data
+        self.assertRaises(ValueError, lambda: paving.from_bytes(b'XXXX' + data[4:]))
+
+    def test_pool(self):
+        from multiprocessing import Pool
+        pool = Pool(2)
+        try:
+            p = sivia(ring, self.box, interval[1, 4], maxdepth=8, contractor=clip, pool=pool)
+        finally:
+            pool.terminate()
+        assert p.to_bytes() == sivia(ring, self.box, interval[1, 4], maxdepth=8, contractor=clip).to_bytes()
@@ -0,0 +1,118 @@
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+import random
+import unittest
+from fractions import Fraction
+
+from interval import interval, fpu
+from interval.polynomial import polynomial
+
+
+def expand(roots):
+    "The coefficients of the monic polynomial with the given roots."
+    p = [Fraction(1)]
+    for r in roots:
+        p = [a - r * b for a, b in zip([0] + p, p + [0])]
+    return p
+
+
+class EvaluationTestCase(unittest.TestCase):
+
+    def test_horner(self):
+        rng = random.Random(7)
+        for i in range(100):
+            p = polynomial([rng.uniform(-5, 5) for j in range(rng.randint(0, 6))])
+            a = rng.uniform(-3, 3)
+            x = interval([a, a + rng.expovariate(1)], rng.uniform(-3, 3))
+            y, z = p(x), p.centered(x)
+            assert z in y
+            for c in x:
+                for t in c.inf, c.sup, c.inf / 2 + c.sup / 2:
+                    v = sum(Fraction(k) * Fraction(t) ** n for n, k in enumerate(p.coefficients))
+                    assert any(Fraction(d.inf) <= v <= Fraction(d.sup) for d in z)
+
+    def test_rounding(self):
+        third = 1 / 3.0
+        p = polynomial([0, 0, 1])
+        assert p(third) == interval[fpu.down(lambda: third * third), fpu.up(lambda: third * third)]
+        p = polynomial([Fraction(1, 3)])
+        assert p(0) == interval[fpu.down(lambda: 1 / fpu.float(3)), fpu.up(lambda: 1 / fpu.float(3))]
+        p = polynomial([interval[-1, 1], interval[2, 3]])
+        assert p(interval[1, 2]) == interval[1, 7]
+
+    def test_special(self):
+        assert polynomial([])(interval[1, 2]) == interval[0]
+        assert polynomial([0, 0])(interval()) == interval()
+        assert polynomial([1, 0, 0]).degree == 0
+        assert polynomial([0, 1])(interval[-fpu.infinity, 0]) == interval[-fpu.infinity, 0]
+        assert polynomial([1, 1])(fpu.infinity) == interval[fpu.infinity]
+        assert polynomial([-1, 0, 1])(interval[-fpu.infinity, fpu.infinity]) == interval[-fpu.infinity, fpu.infinity]
+
+    def test_centered(self):
+        p = polynomial([1, -2, 0, 1])
+        x = interval[0.5, 0.7]
+        assert p.centered(x) in p(x)
+        assert interval[p(0.7)[0].sup, p(0.5)[0].inf] in p.centered(x)
+        assert p.centered(interval([0.5, 0.7], 3)) == p.centered(x) | p(3)
+        assert polynomial([1, 2]).centered(x) == polynomial([1, 2])(x)
+
+    def test_derivative(self):
+        assert polynomial([1, -2, 0, 1]).derivative().coefficients == (-2, 0, 3)
+        assert polynomial([Fraction(1, 3), Fraction(1, 3)]).derivative().coefficients == (Fraction(1, 3),)
+        assert polynomial([5]).derivative().degree == -1
+        d = polynomial([0, 0, 0, 0.1]).derivative().coefficients
+        assert 3 * Fraction(0.1) in interval[d[-1][0]] and d[-1][0].inf < d[-1][0].sup
+
+
+class RootsTestCase(unittest.TestCase):
+
+    def check(self, roots, x=None):
+        p = polynomial(expand(roots))
+        expected = sorted(set(r for r in roots if x is None or r in x))
+        found = p.isolate(x)
+        assert len(found) == len(expected)
+        for (a, b), r in zip(found, expected):
+            assert a <= r <= b
+        y = p.roots(x)
+        assert len(y) == len(expected)
+        for c, r in zip(y, expected):
+            assert Fraction(c.inf) <= r <= Fraction(c.sup)
+            assert c.sup - c.inf <= 4 * abs(c.sup) * 2 ** -52 + 5e-324
+        return y
+
+    def test_simple(self):
+        self.check([1, 2, 3])
+        self.check([-1, 0, 1])
+        self.check([Fraction(1, 3), Fraction(-7, 5), 10])
+        self.check([Fraction(n, 10) for n in range(-10, 11)])
+
+    def test_multiple(self):
+        self.check([2, 2, Fraction(1, 3)])
+        self.check([0, 0, 0, 1, 1])
+
+    def test_clustered(self):
+        self.check([1, 1 + Fraction(1, 10 ** 6), 1 + Fraction(2, 10 ** 6)])
+
+    def test_irrational(self):
+        y = polynomial([-2, 0, 1]).roots()
+        assert y == interval([-1.4142135623730951, -1.414213562373095], [1.414213562373095, 1.4142135623730951])
+        assert polynomial([1, 0, 1]).roots() == interval()
+        assert polynomial([7]).roots() == interval()
+
+    def test_domain(self):
+        self.check([1, 2, 3], interval[1.5, 3])
+        self.check([1, 2, 3], interval([0, 1], [2.5, 5]))
+        self.check([1, 2, 3], interval[-fpu.infinity, 2])
+        assert polynomial([-2, 0, 1]).roots(interval[0, 1]) == interval()
+
+    def test_newton(self):
+        p = polynomial(expand([1, 2, 3, 4]))
+        y, z = p.roots(), interval[0, 5].newton(p, p.derivative())
+        assert len(y) == len(z) == 4 and y in z
+
+    def test_errors(self):
+        self.assertRaises(ValueError, polynomial([]).isolate)
+        self.assertRaises(ValueError, polynomial([interval[1, 2], 1]).isolate)
+        self.assertRaises(ValueError, polynomial([1, interval[1, 2]]).roots)
@@ -0,0 +1,72 @@
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+import threading
+import unittest
+
+from six import StringIO
+
+from interval import interval, fpu, imath
+
+
+class ProfileTestCase(unittest.TestCase):
+
+    def test_counts(self):
+        x, y = interval([1, 2], [3, 4], [5, 6]), interval([0, 1], [2, 3])
+        with interval.profile() as stats:
+            z = x * y
+            w = (z & interval[0, 10]) | x
+        assert stats.calls['interval.__mul__'] == stats.calls['interval.__and__'] == stats.calls['interval.__or__'] == 1
+        assert stats.pairs == 6 + len(z)
+        assert stats.switches == 2 * 6 == stats.switches_by['interval.__mul__']
+        assert stats.components[len(w)] >= 1 and stats.sorted[6] == 1
+        assert all(t >= 0 for t in stats.time.values())
+
+    def test_imath(self):
+        with interval.profile() as stats:
+            imath.exp(imath.sin(interval[0, 1]))
+            imath.sincos(2)
+        assert stats.calls['imath.exp'] == stats.calls['imath.sin'] == stats.calls['imath.sincos'] == 1
+
+    def test_switches(self):
+        with interval.profile() as stats:
+            fpu.up(lambda: 1.0 / 3)
+            interval[1, 2] ** 3
+            interval[1, 2] * interval[3, 4]
+        assert stats.switches == sum(stats.switches_by.values()) == 1 + stats.switches_by['interval.__pow__'] + 2
+        assert stats.switches_by['(block)'] == 1 and stats.switches_by['interval.__mul__'] == 2
+
+    def test_restore(self):
+        saved = interval.__dict__.copy(), vars(fpu).copy(), vars(imath).copy()
+        self.assertRaises(ZeroDivisionError, self.failing)
+        assert (interval.__dict__.copy(), vars(fpu).copy(), vars(imath).copy()) == saved
+        with interval.profile() as stats:
+            self.assertRaises(RuntimeError, interval.profile().__enter__)
+            interval[1, 2] + 1
+        assert stats.calls['interval.__add__'] == 1
+        assert (interval.__dict__.copy(), vars(fpu).copy(), vars(imath).copy()) == saved
+
+    def failing(self):
+        with interval.profile():
+            1 / 0
+
+    def test_threads(self):
+        def work():
+            for i in range(100):
+                interval[1, 2] * interval[3, 4]
+        with interval.profile() as stats:
+            threads = [threading.Thread(target=work) for i in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        assert stats.calls['interval.__mul__'] == 400 and stats.pairs == 400
+
+    def test_report(self):
+        with interval.profile() as stats:
+            interval[1, 2] * 3
+        out = StringIO()
+        stats.report(out)
+        assert 'interval.__mul__' in out.getvalue() and 'components sorted' in out.getvalue()
+        assert 'rounding mode switches' in out.getvalue()
@@ -0,0 +1,69 @@
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+import math
+import unittest
+
+from interval import interval, imath, fpu
+from interval.quadrature import integrate
+
+
+class IntegrateTestCase(unittest.TestCase):
+
+    def test_riemann(self):
+        y = integrate(lambda x: x ** 2, interval[0, 1], 0.05)
+        assert interval[1] / 3 in y
+        assert y[0].sup - y[0].inf <= 0.05
+
+    def test_taylor(self):
+        e1 = imath.exp(1) - 1
+        y1 = integrate(imath.exp, interval[0, 1], 1e-6, p=imath.exp)
+        y2 = integrate(imath.exp, interval[0, 1], 1e-6, p=imath.exp, p2=imath.exp)
+        for y in y1, y2:
+            assert e1 & y
+            assert y[0].sup - y[0].inf <= 1e-6
+
+    def test_exact(self):
+        assert integrate(lambda x: 2 + 0 * x, interval[1, 3], 1e-9) == interval[4]
+        assert integrate(lambda x: x, interval[-1, 1], 1e-9, p=lambda x: interval[1]) == interval[0]
+
+    def test_components(self):
+        y = integrate(lambda x: x, interval([0, 1], [2, 3]), 1e-9, p=lambda x: interval[1])
+        assert y == interval[3]
+        assert integrate(lambda x: x, interval(), 1e-9) == interval[0]
+
+    def test_maxeval(self):
+        calls = []
+
+        def f(x):
+            calls.append(x)
+            return imath.exp(x)
+
+        y = integrate(f, interval[0, 1], 0, maxeval=100)
+        assert math.e - 1 in y
+        assert len(calls) <= 101
+
+    def test_undefined(self):
+        assert integrate(imath.log, interval[-2, -1], 1e-3) == interval()
+        assert integrate(lambda x: 1 / x, interval[-1, 1], 1e-3) == interval[-fpu.infinity, fpu.infinity]
+
+    def test_unbounded(self):
+        # The enclosure of log is unbounded on the parts next to 0,
+        # which are bisected until they cannot be split any further.
+        y = integrate(imath.log, interval[0, 1], 1e-3, maxeval=5000)
+        assert -1 in y and y[0].inf == -fpu.infinity and y[0].sup < -0.99
+
+    def test_pool(self):
+        from multiprocessing import Pool
+
+        class serial(object):
+            map = staticmethod(map)
+
+        pool = Pool(2)
+        try:
+            y = integrate(imath.exp, interval[0, 1], 1e-4, p=imath.exp, pool=pool, chunksize=4)
+        finally:
+            pool.terminate()
+        assert y == integrate(imath.exp, interval[0, 1], 1e-4, p=imath.exp, pool=serial, chunksize=4)
+        assert imath.exp(1) - 1 & y
@@ -0,0 +1,75 @@
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+import random
+import unittest
+
+from interval import interval, fpu
+from interval.sets import IntervalSet
+
+
+class IntervalSetTestCase(unittest.TestCase):
+
+    def test_add(self):
+        rng = random.Random(3)
+        s, x = IntervalSet(), interval()
+        for i in range(300):
+            a = rng.uniform(0, 100)
+            y = interval[a, a + rng.expovariate(1)]
+            s.add(y)
+            x |= y
+            assert s.freeze() == x
+        assert len(s) == len(x)
+        assert list(s) == list(x.components)
+
+    def test_touching(self):
+        s = IntervalSet([interval[0, 1], interval[2, 3]])
+        s.add(interval[1, 2])
+        assert s.freeze() == interval[0, 3]
+        s.add(interval(5, [-fpu.infinity, -1]))
+        assert s.freeze() == interval([-fpu.infinity, -1], [0, 3], 5)
+        s.update([interval[4, 6], interval[7]])
+        assert s.freeze() == interval([-fpu.infinity, -1], [0, 3], [4, 6], 7)
+
+    def test_remove(self):
+        s = IntervalSet([interval([0, 10], [20, 30], [40, 50], 60)])
+        s.remove(interval[5, 25])
+        assert s.freeze() == interval([0, 5], [25, 30], [40, 50], 60)
+        s.remove(interval(60, 45))
+        assert s.freeze() == interval([0, 5], [25, 30], [40, 50])
+        s.remove(interval[30, 40])
+        assert s.freeze() == interval([0, 5], [25, 30], [40, 50])
+        s.remove(interval[-fpu.infinity, 0])
+        assert s.freeze() == interval([0, 5], [25, 30], [40, 50])
+        s.remove(interval[42, 43])
+        assert s.freeze() == interval([0, 5], [25, 30], [40, 42], [43, 50])
+        s.remove(interval[-fpu.infinity, fpu.infinity])
+        assert s.freeze() == interval() and len(s) == 0
+
+    def test_contains(self):
+        s = IntervalSet([interval([0, 1], 3)])
+        assert 0 in s and 1 in s and 3 in s
+        assert -1 not in s and 2 not in s and 4 not in s
+        s.clear()
+        assert 0 not in s
+
+    def test_blocks(self):
+        class SmallIntervalSet(IntervalSet):
+            _load = 2
+        rng = random.Random(5)
+        s = SmallIntervalSet([interval[i, i + 0.5] for i in range(0, 100, 3)])
+        x = s.freeze()
+        assert len(s._blocks) > 1
+        for i in range(500):
+            a = rng.uniform(0, 100)
+            y = interval[a, a + rng.expovariate(0.3)]
+            if rng.random() < 0.5:
+                s.add(y)
+                x |= y
+            else:
+                s.remove(y)
+                x = x.difference(y)
+            assert s.freeze() == x and len(s) == len(x)
+            assert all(len(infs) <= 4 for infs, _ in s._blocks)
+            assert all((p in s) == (p in x) for p in (a, y[0].sup, rng.uniform(0, 100)))
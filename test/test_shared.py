@@ -0,0 +1,93 @@
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+import pickle
+import unittest
+
+from interval import interval, imath, fpu
+
+try:
+    from interval.shared import SharedIntervalArray, evaluate
+except ImportError:  # pragma: nocover
+    SharedIntervalArray = None
+
+
+def reciprocal(x):
+    return 1 / x
+
+
+@unittest.skipIf(SharedIntervalArray is None, 'shared memory is not available')
+class SharedTestCase(unittest.TestCase):
+
+    data = [interval[1, 2], interval(), interval(3, [4, 5]), interval[-fpu.infinity, 0]]
+
+    def setUp(self):
+        self.arrays = []
+
+    def tearDown(self):
+        for a in self.arrays:
+            a.unlink()
+
+    def make(self, *args, **kwargs):
+        if args and not isinstance(args[0], int):
+            a = SharedIntervalArray.from_intervals(*args, **kwargs)
+        else:
+            a = SharedIntervalArray(*args, **kwargs)
+        self.arrays.append(a)
+        return a
+
+    def test_items(self):
+        a = self.make(self.data)
+        assert a.capacity == 2
+        assert list(a) == self.data
+        assert a[-1] == self.data[-1]
+        a[0] = interval[7]
+        assert a[0] == interval[7]
+        self.assertRaises(IndexError, lambda: a[4])
+        self.assertRaises(ValueError, a.__setitem__, 1, interval(1, 2, 3))
+
+    def test_pickle(self):
+        a = self.make(self.data)
+        assert pickle.loads(pickle.dumps(a)) is a
+        b = SharedIntervalArray(0, name=a.name)
+        try:
+            assert list(b) == self.data
+            b[1] = interval[-1, 1]
+            assert a[1] == interval[-1, 1]
+            assert pickle.loads(pickle.dumps(b)) is a
+        finally:
+            b.close()
+        assert pickle.loads(pickle.dumps(a)) is a
+        assert list(pickle.loads(pickle.dumps(a))) == list(a)
+
+    def test_close(self):
+        a = SharedIntervalArray.from_intervals(self.data)
+        b = SharedIntervalArray(0, name=a.name)
+        self.arrays.append(b)
+        a.close()
+        c = pickle.loads(pickle.dumps(b))
+        assert c is not a
+        try:
+            assert list(c) == self.data
+        finally:
+            c.close()
+
+    def test_evaluate(self):
+        x = self.make(self.data)
+        y = evaluate(reciprocal, x, chunksize=3)
+        self.arrays.append(y)
+        assert list(y) == [reciprocal(v) for v in self.data]
+        self.assertRaises(ValueError, evaluate, reciprocal, x, self.make(2))
+
+    def test_pool(self):
+        from multiprocessing import Pool
+        xs = [interval[i, i + 1] for i in range(100)]
+        x, out = self.make(xs), self.make(100)
+        pool = Pool(2)
+        try:
+            assert evaluate(imath.exp, x, out, pool=pool, chunksize=16) is out
+        finally:
+            pool.close()
+            pool.join()
+        assert list(out) == [imath.exp(v) for v in xs]
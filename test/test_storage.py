@@ -0,0 +1,104 @@
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from interval import interval, fpu
+from interval.storage import IntervalArray, IntervalWriter, save, load
+
+
+class StorageTestCase(unittest.TestCase):
+
+    data = [
+        interval[1, 2],
+        interval(),
+        interval(3, [4, 5], [-fpu.infinity, -7]),
+        interval[0.1],
+        interval[-fpu.infinity, fpu.infinity],
+    ]
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'test.ivl')
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_memory(self):
+        a = IntervalArray.from_intervals(self.data)
+        assert len(a) == len(self.data)
+        assert list(a) == self.data
+        assert list(a.offsets) == [0, 1, 1, 4, 5, 6]
+        assert a[-1] == self.data[-1]
+
+    def test_roundtrip(self):
+        save(self.path, self.data)
+        with load(self.path) as a:
+            assert list(a) == self.data
+            assert list(a.offsets) == [0, 1, 1, 4, 5, 6]
+            assert a[2] == self.data[2]
+
+    def test_empty_file(self):
+        save(self.path, [])
+        with load(self.path) as a:
+            assert len(a) == 0
+            assert list(a) == []
+
+    def test_slice(self):
+        save(self.path, self.data)
+        with load(self.path) as a:
+            assert list(a[1:4]) == self.data[1:4]
+            assert list(a[-2:]) == self.data[-2:]
+            assert list(a[4:2]) == []
+            self.assertRaises(ValueError, lambda: a[::2])
+            self.assertRaises(IndexError, lambda: a[len(self.data)])
+
+    def test_close(self):
+        save(self.path, self.data)
+        a = load(self.path)
+        b = a[1:4]
+        c = b[1:]
+        assert list(c) == self.data[2:4]
+        views = hasattr(a.offsets, 'release')
+        a.close()
+        if views:
+            self.assertRaises(ValueError, list, b)
+            self.assertRaises(ValueError, list, c)
+
+    def test_writer(self):
+        with IntervalWriter(self.path) as w:
+            w.write(1)
+            w.extend([interval[2, 3], interval[4, 5]])
+        with load(self.path) as a:
+            assert list(a) == [interval[1], interval[2, 3], interval[4, 5]]
+
+    def test_invalid(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'\0' * 64)
+        self.assertRaises(ValueError, load, self.path)
+
+    def test_numpy(self):
+        try:
+            import numpy
+        except ImportError:
+            raise unittest.SkipTest('numpy is not installed')
+        save(self.path, self.data)
+        a = load(self.path)
+        offsets, endpoints = a.numpy()
+        assert isinstance(offsets, numpy.ndarray) and isinstance(endpoints, numpy.ndarray)
+        assert offsets.tolist() == [0, 1, 1, 4, 5, 6]
+        assert endpoints.shape == (6, 2)
+        assert endpoints[0].tolist() == [1.0, 2.0]
+        del offsets, endpoints
+        a.close()
+
+        # A failure to close does not mask the exception of the block
+        def fail():
+            with load(self.path) as a:
+                views = a.numpy()  # noqa
+                raise ZeroDivisionError
+        self.assertRaises(ZeroDivisionError, fail)
@@ -0,0 +1,46 @@
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+import random
+import unittest
+
+from interval import interval, fpu
+from interval.streaming import union, hull
+
+
+class serial(object):
+    map = staticmethod(lambda f, xs: list(map(f, xs)))
+
+
+class StreamingTestCase(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(11)
+        self.data = []
+        for i in range(2000):
+            a = rng.uniform(-1000, 1000)
+            self.data.append(interval([a, a + rng.expovariate(0.5)], rng.uniform(-1000, 1000)))
+        self.data += [interval(), interval[5], interval[-fpu.infinity, -999], interval[0, 1], interval[1, 2]]
+
+    def test_union(self):
+        expected = interval.union(self.data)
+        for chunksize in 1, 7, 100, 10000:
+            assert union(iter(self.data), chunksize) == expected
+            assert union(self.data, chunksize, pool=serial, waves=3) == expected
+        assert union([]) == interval()
+        assert union([interval()], pool=serial) == interval()
+
+    def test_pool(self):
+        from multiprocessing import Pool
+        pool = Pool(2)
+        try:
+            assert union(self.data, 100, pool=pool) == interval.union(self.data)
+        finally:
+            pool.close()
+            pool.join()
+
+    def test_hull(self):
+        assert hull(iter(self.data)) == interval.hull(self.data)
+        assert hull([interval(), 3, interval[1, 2]]) == interval[1, 3]
+        self.assertRaises(ValueError, hull, [interval()])
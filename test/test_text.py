@@ -0,0 +1,81 @@
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+import io
+import sys
+import unittest
+from fractions import Fraction
+
+from interval import interval, fpu
+from interval.text import parse, iterparse, parse_array, format_all, dump
+
+
+class ParseTestCase(unittest.TestCase):
+
+    def test_notations(self):
+        assert parse('interval()') == interval()
+        assert parse('interval([1.0, 2.0], [3.0])') == interval[1, 2] | interval[3]
+        assert parse('  interval( [1, 2] , [5,6] ) ') == interval([1, 2], [5, 6])
+        assert parse('[1, 2], [5, 6]') == interval([1, 2], [5, 6])
+        assert parse('interval([+1.5e+00, +2.0])') == interval[1.5, 2]
+        assert parse('[3, 1]') == interval[1, 3]
+        assert parse('7') == interval[7]
+        assert parse('[-inf, inf]') == interval[-fpu.infinity, fpu.infinity]
+        assert parse('[1, 3], [2, 4]') == interval[1, 4]
+
+    def test_invalid(self):
+        for s in ['', '[1,', '[1, 2],', 'x', '[1 2]', 'interval([1],)', 'nan', '[1, 2] 3']:
+            self.assertRaises(ValueError, parse, s)
+
+    def test_outward(self):
+        for s in ['0.1', '-0.3', '1e-310', '2.3e+30', '123456789012345678901234567890', '0.7e100']:
+            x = parse(s)
+            assert len(x) == 1
+            c = x[0]
+            assert Fraction(c.inf) < Fraction(s) < Fraction(c.sup)
+            assert fpu.down(lambda: c.sup - 5e-324) == c.inf
+        assert parse('0.5') == interval[0.5]
+        assert parse('12345') == interval[12345]
+        assert parse('1e400') == interval[sys.float_info.max, fpu.infinity]
+        assert parse('-1e400') == interval[-fpu.infinity, -sys.float_info.max]
+        assert parse('1e-400') == interval[0, 5e-324]
+
+    def test_roundtrip(self):
+        for x in [interval[0.1, 0.3], interval(1 / 3.0, [2, 1e300]), interval[-fpu.infinity, 2 ** -1074], interval()]:
+            assert parse(repr(x), exact=True) == x
+            assert x in parse(repr(x))
+            assert parse(x.format('%.17g'), exact=True) == x
+            assert parse(x.format('%.16E'), exact=True) == x
+            assert parse(x.format('%.17G'), exact=True) == x
+
+    def test_uppercase(self):
+        x = interval([-fpu.infinity, -2], [1.5, fpu.infinity])
+        assert x.format('%E') == 'interval([-INF, -2.000000E+00], [1.500000E+00, INF])'
+        assert parse(x.format('%E')) == parse(x.format('%G')) == x
+        assert parse('[1E3, Inf]') == interval[1000, fpu.infinity]
+
+    def test_bulk(self):
+        f = io.StringIO(u'[0.1, 0.2]\n\ninterval([1.0], [2.0, 3.0])\n4\n')
+        xs = list(iterparse(f))
+        assert xs == [parse('[0.1, 0.2]'), interval(1, [2, 3]), interval[4]]
+        a = parse_array(['[1, 2]', 'interval([1.0], [2.0, 3.0])'], exact=True)
+        assert list(a) == [interval[1, 2], interval(1, [2, 3])]
+        assert list(a.offsets) == [0, 1, 3]
+
+
+class FormatTestCase(unittest.TestCase):
+
+    data = [interval[1, 2], interval[0.1], interval(), interval(1, [2, 3], [-fpu.infinity, 0])]
+
+    def test_format_all(self):
+        assert format_all(self.data) == [repr(x) for x in self.data]
+        assert format_all(self.data, '%.3e') == [x.format('%.3e') for x in self.data]
+        assert format_all([]) == []
+
+    def test_dump(self):
+        f = io.StringIO()
+        dump(self.data, f)
+        assert f.getvalue() == ''.join(repr(x) + '\n' for x in self.data)
+        f.seek(0)
+        assert list(iterparse(f, exact=True)) == self.data
@@ -0,0 +1,76 @@
+# Copyright (c) 2008-2016, Stefano Taschini <taschini@ieee.org>
+# All rights reserved.
+# See LICENSE for details.
+
+import sys
+import threading
+import time
+import unittest
+
+from interval import interval, fpu, imath
+from interval.threads import thread_map
+
+
+class ThreadsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        if hasattr(sys, 'setswitchinterval'):
+            self.interval = sys.getswitchinterval()
+            sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        if hasattr(sys, 'setswitchinterval'):
+            sys.setswitchinterval(self.interval)
+
+    def test_stress(self):
+        one, three, ten = 1.0, 3.0, 10.0
+
+        def quotients():
+            # Yield to the other threads while the rounding mode is set
+            time.sleep(0)
+            return one / three, one / ten
+
+        # 1/3 is rounded to nearest downwards, and 1/10 upwards, so
+        # that the three rounding modes give different pairs
+        nearest = quotients()
+        lo, hi = fpu.down(quotients), fpu.up(quotients)
+        assert lo[0] == nearest[0] < hi[0] and lo[1] < nearest[1] == hi[1]
+        errors = []
+
+        def work(k):
+            for i in range(300):
+                j = (i + k) % 3
+                if j == 0:
+                    results = fpu.down(lambda: (quotients(), fpu.up(quotients), quotients())), (lo, hi, lo)
+                elif j == 1:
+                    results = fpu.up(quotients), hi
+                else:
+                    results = quotients(), nearest
+                if results[0] != results[1]:
+                    errors.append((k, i, results))
+
+        threads = [threading.Thread(target=work, args=(k,)) for k in range(16)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert errors == []
+
+    def test_restore_on_exception(self):
+        one, ten = 1.0, 10.0
+
+        def fail():
+            raise ZeroDivisionError
+        self.assertRaises(ZeroDivisionError, fpu.up, fail)
+        assert fpu.down(lambda: one / ten) < one / ten == fpu.up(lambda: one / ten)
+        self.assertRaises(ZeroDivisionError, fpu.down, fail)
+        assert fpu.down(lambda: one / ten) < one / ten == fpu.up(lambda: one / ten)
+
+    def test_thread_map(self):
+        xs = [interval[i / 7.0, i / 3.0] for i in range(200)]
+
+        def f(x):
+            return imath.exp(x) * imath.cos(x) + x ** 3 / 3
+        assert thread_map(f, xs, workers=8, chunksize=5) == [f(x) for x in xs]
+        assert thread_map(f, []) == []
+        self.assertRaises(ZeroDivisionError, thread_map, lambda x: 1 // 0, [1, 2])